@@ -1,9 +1,12 @@
+import time
+
 from django.contrib import admin
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
 from solo.admin import SingletonModelAdmin
 
+from .cache import get_health_status
 from .models import Configuration
 
 
@@ -16,11 +19,23 @@ class ConfigurationAdmin(SingletonModelAdmin):
                 "fields": (
                     "api_root",
                     "api_token",
-                    "client_timeout",
                     "status",
                 )
             },
         ),
+        (
+            _("Timeouts and retries"),
+            {
+                "fields": (
+                    "client_timeout",
+                    "connect_timeout",
+                    "read_timeout",
+                    "request_deadline",
+                    "max_retries",
+                    "retry_backoff",
+                ),
+            },
+        ),
         (
             _("SDK"),
             {
@@ -43,5 +58,32 @@ class ConfigurationAdmin(SingletonModelAdmin):
     def status(self, obj):
         from django.contrib.admin.templatetags.admin_list import _boolean_icon
 
-        healthy, message = obj.client.is_healthy()
-        return format_html("{} {}", _boolean_icon(healthy), message)
+        # The status is checked in the background to not block the admin page
+        # when Open Forms is slow or unavailable.
+        status = get_health_status()
+        if status is None:
+            return format_html(
+                "{} {}", _boolean_icon(None), _("The status is being checked.")
+            )
+
+        details = _("Checked %(age)d seconds ago in %(latency)d ms.") % {
+            "age": max(time.time() - status.checked_at, 0),
+            "latency": status.latency * 1000,
+        }
+        circuit_breaker = obj.client.circuit_breaker
+        if circuit_breaker.state != circuit_breaker.CLOSED:
+            details = _(
+                "%(details)s Requests fail fast after %(failures)d failures "
+                "(circuit %(state)s)."
+            ) % {
+                "details": details,
+                "failures": circuit_breaker.failures,
+                "state": circuit_breaker.state,
+            }
+
+        return format_html(
+            "{} {} <small>{}</small>",
+            _boolean_icon(status.healthy),
+            status.message,
+            details,
+        )
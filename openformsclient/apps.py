@@ -1,5 +1,43 @@
+import logging
+
 from django.apps import AppConfig
+from django.core.signals import request_started
+
+logger = logging.getLogger(__name__)
+
+WARM_CACHE_DISPATCH_UID = "openformsclient.warm_cache"
 
 
 class OpenFormsClientConfig(AppConfig):
     name = "openformsclient"
+
+    def ready(self):
+        from . import signals  # noqa
+        from .settings import get_setting
+
+        # The database and Open Forms should not be used while the
+        # application is loaded, which also happens for management commands
+        # like migrate, so the cache is warmed on the first request instead.
+        if get_setting("WARM_CACHE_ON_STARTUP"):
+            request_started.connect(
+                warm_cache_on_first_request, dispatch_uid=WARM_CACHE_DISPATCH_UID
+            )
+
+
+def warm_cache():
+    from .cache import warm_form_cache
+
+    try:
+        warm_form_cache()
+    except Exception as exc:
+        logger.exception(exc)
+
+
+def warm_cache_on_first_request(sender, **kwargs):
+    # Only the request that disconnects the receiver warms the cache.
+    if not request_started.disconnect(dispatch_uid=WARM_CACHE_DISPATCH_UID):
+        return
+
+    from .cache import run_in_background
+
+    run_in_background(warm_cache)
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import weakref
+from typing import Tuple
+from urllib.parse import urljoin
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+from .client import get_next_page_url
+
+logger = logging.getLogger(__name__)
+
+# Async clients hold connections that are bound to the event loop they were
+# created in, so they are registered per event loop.
+_async_clients = weakref.WeakKeyDictionary()
+
+# The closing of replaced clients, which the event loop only keeps a weak
+# reference to.
+_closing = set()
+
+
+class AsyncClient:
+    """
+    Async counterpart of :class:`openformsclient.client.Client`.
+
+    Requires `httpx`_ to be installed, which is available via the ``async``
+    extra.
+
+    .. _`httpx`: https://www.python-httpx.org/
+    """
+
+    def __init__(
+        self,
+        api_root,
+        api_token,
+        client_timeout,
+        connect_timeout=None,
+        read_timeout=None,
+        max_retries=0,
+        pool_maxsize=10,
+        transport=None,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "The AsyncClient requires httpx. Install it with: "
+                "pip install django-open-forms-client[async]"
+            )
+
+        self.api_root = api_root
+        self.api_token = api_token
+        self.timeout = (
+            connect_timeout or client_timeout,
+            read_timeout or client_timeout,
+        )
+        self.max_retries = max_retries
+        self.pool_maxsize = pool_maxsize
+
+        self._transport = transport
+        self._session = None
+
+    @property
+    def session(self) -> "httpx.AsyncClient":
+        """
+        The HTTP session that keeps connections to Open Forms alive.
+        """
+        if self._session is None:
+            self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> "httpx.AsyncClient":
+        # Retries of the transport only apply to connection errors, so these
+        # are safe for any request method.
+        transport = self._transport or httpx.AsyncHTTPTransport(
+            retries=self.max_retries,
+            limits=httpx.Limits(
+                max_connections=self.pool_maxsize,
+                max_keepalive_connections=self.pool_maxsize,
+            ),
+        )
+        connect_timeout, read_timeout = self.timeout
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+        )
+
+    async def aclose(self):
+        """
+        Close the HTTP session and all its pooled connections.
+        """
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _request(self, method, relative_url, **extra_kwargs):
+        kwargs = {
+            "headers": {"Authorization": f"Token {self.api_token}"},
+        }
+        kwargs.update(extra_kwargs)
+
+        response = await self.session.request(
+            method, urljoin(self.api_root, relative_url), **kwargs
+        )
+
+        return response
+
+    def has_config(self) -> bool:
+        return bool(self.api_root and self.api_token)
+
+    async def is_healthy(self) -> Tuple[bool, str]:
+        try:
+            # We do a head request to actually hit a protected endpoint without
+            # getting a whole bunch of data.
+            response = await self._request("head", "public/forms")
+            response.raise_for_status()
+            return (True, "")
+        except httpx.HTTPStatusError as e:
+            # If something is wrong, we might get more information from the
+            # error message provided by Open Forms.
+            try:
+                response = await self._request("get", "public/forms")
+                data = response.json()
+                message = (
+                    data.get("detail", data.get("title"))
+                    or f"HTTP {response.status_code}"
+                )
+            except Exception:
+                message = f"Server did not return a valid response (HTTP {e.response.status_code})."
+        except Exception as e:
+            logger.exception(e)
+            message = str(e)
+
+        return (False, message)
+
+    async def get_forms(self) -> list:
+        """
+        Retrieve all available forms in Open Forms API.
+
+        If the API paginates the forms, all pages are retrieved.
+
+        :returns: The forms in the API response content as Python object.
+        """
+        forms = []
+        url = "public/forms"
+        while url:
+            response = await self._request("get", url)
+            response.raise_for_status()
+
+            data = response.json()
+            # The response is either a list of forms, or a paginated response.
+            if isinstance(data, dict):
+                forms += data["results"]
+                url = data.get("next")
+                if url:
+                    url = get_next_page_url(self.api_root, url)
+            else:
+                forms += data
+                url = None
+
+        return forms
+
+    async def get_form(self, uuid_or_slug: str) -> dict:
+        """
+        Retrieve a specific form from the Open Forms API.
+
+        :param uuid_or_slug: The UUID or the slug that identifies the form.
+        :returns: The API response content as Python object.
+        """
+        response = await self._request("get", f"forms/{uuid_or_slug}")
+        response.raise_for_status()
+
+        return response.json()
+
+
+def get_async_client(api_root, api_token, client_timeout, **options) -> AsyncClient:
+    """
+    Return the async client for the given configuration in the running event
+    loop.
+
+    See :func:`openformsclient.client.get_client`. Unlike the regular clients,
+    replaced async clients are closed in their event loop. Clients of event
+    loops that stopped running, like the short-lived event loops of
+    ``async_to_sync``, can't be closed anymore and are only removed.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.setdefault(loop, {})
+    fingerprint = (api_root, api_token, client_timeout, tuple(sorted(options.items())))
+
+    client = clients.get(fingerprint)
+    if client is None:
+        client = AsyncClient(api_root, api_token, client_timeout, **options)
+        # There is only one configuration, so any other client is outdated.
+        for outdated in clients.values():
+            _close_async_client(loop, outdated)
+        clients.clear()
+        clients[fingerprint] = client
+
+        for other_loop in list(_async_clients):
+            if other_loop.is_closed():
+                _async_clients.pop(other_loop, None)
+    return client
+
+
+def clear_async_clients():
+    """
+    Close and remove all async clients from the registry.
+    """
+    for loop, clients in list(_async_clients.items()):
+        for client in clients.values():
+            _close_async_client(loop, client)
+    _async_clients.clear()
+
+
+def _close_async_client(loop, client):
+    """
+    Schedule the closing of ``client`` in its event loop ``loop``, which can
+    be running in another thread.
+    """
+    if client._session is None or loop.is_closed() or not loop.is_running():
+        return
+
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+
+    if running_loop is loop:
+        closing = loop.create_task(client.aclose())
+    else:
+        closing = asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    _closing.add(closing)
+    closing.add_done_callback(_closing.discard)
@@ -0,0 +1,408 @@
+import logging
+import threading
+import time
+from typing import List, NamedTuple, Optional
+
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connections
+
+from .client import Validators
+from .index import FormIndex
+from .lru import LRUCache
+from .settings import get_setting
+from .summary import FormSummary
+
+logger = logging.getLogger(__name__)
+
+# The forms are cached once for all fields, regardless of whether they use the
+# UUID or slug. The key is scoped to the configuration with its version, see
+# get_forms_cache_key().
+FORMS_CACHE_KEY = "openformsclient.forms"
+
+HEALTH_CACHE_KEY = "openformsclient.health"
+
+# The index of the cached forms in this process, with the time the forms were
+# retrieved to know when the index is outdated.
+_form_index = None
+
+# The two-level cache of this process, with the settings it was created with.
+_two_level_cache = None
+
+_MISSING = object()
+
+# The number of seconds to wait for another worker that retrieves a value that
+# isn't cached yet, and how often to check if it's done.
+COLD_CACHE_WAIT = 5
+COLD_CACHE_POLL_INTERVAL = 0.1
+
+
+class TwoLevelCache:
+    """
+    Cache that keeps values of the shared Django cache in this process for a
+    short time, to avoid a round trip to the shared cache for every lookup.
+
+    Values are written to both levels. Additions, used as locks, only go to
+    the shared cache. A value that is changed or deleted by another process
+    can be served by this process for at most ``local_timeout`` seconds.
+
+    :param alias: The alias of the shared Django cache.
+    :param local_timeout: The maximum number of seconds a value is kept in
+        this process.
+    :param maxsize: The maximum number of values kept in this process.
+    """
+
+    def __init__(self, alias, local_timeout, maxsize=16):
+        self.alias = alias
+        self.local = LRUCache(maxsize=maxsize, timeout=local_timeout)
+        self.local_timeout = local_timeout
+
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def shared(self):
+        # Django cache connections are per thread.
+        return caches[self.alias]
+
+    @property
+    def stats(self) -> dict:
+        """
+        The number of lookups served from this process, from the shared cache
+        and from neither.
+        """
+        return {
+            "local_hits": self.local_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+        }
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key, default=None):
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            self._count("local_hits")
+            return value
+
+        value = self.shared.get(key, _MISSING)
+        if value is _MISSING:
+            self._count("misses")
+            return default
+
+        self._count("shared_hits")
+        self.local.set(key, value)
+        return value
+
+    def set(self, key, value, timeout=None):
+        self.shared.set(key, value, timeout=timeout)
+        local_timeout = self.local_timeout
+        if timeout is not None:
+            local_timeout = min(timeout, local_timeout)
+        self.local.set(key, value, timeout=local_timeout)
+
+    def add(self, key, value, timeout=None):
+        return self.shared.add(key, value, timeout=timeout)
+
+    def delete(self, key):
+        self.local.delete(key)
+        self.shared.delete(key)
+
+
+def get_shared_cache():
+    """
+    Return the Django cache ``OPENFORMSCLIENT_CACHE_ALIAS``, which is shared by
+    all processes if it's a cache server like Redis.
+    """
+    return caches[get_setting("CACHE_ALIAS")]
+
+
+def is_shared_cache() -> bool:
+    """
+    Return whether the Django cache ``OPENFORMSCLIENT_CACHE_ALIAS`` is shared by
+    all processes. A local memory cache only lives in its own process, and a
+    dummy cache doesn't keep anything.
+    """
+    return not isinstance(get_shared_cache(), (LocMemCache, DummyCache))
+
+
+def get_cache():
+    """
+    Return the cache for the forms and health status: the Django cache
+    ``OPENFORMSCLIENT_CACHE_ALIAS``, with a :class:`TwoLevelCache` in front of
+    it if ``OPENFORMSCLIENT_LOCAL_CACHE_TIMEOUT`` is set.
+    """
+    global _two_level_cache
+
+    local_timeout = get_setting("LOCAL_CACHE_TIMEOUT")
+    if not local_timeout:
+        return get_shared_cache()
+
+    alias = get_setting("CACHE_ALIAS")
+    two_level_cache = _two_level_cache
+    if (
+        two_level_cache is None
+        or two_level_cache.alias != alias
+        or two_level_cache.local_timeout != local_timeout
+    ):
+        two_level_cache = _two_level_cache = TwoLevelCache(alias, local_timeout)
+    return two_level_cache
+
+
+def run_in_background(func):
+    """
+    Run ``func`` in a daemon thread and return the thread.
+    """
+
+    def _run():
+        try:
+            func()
+        finally:
+            # The thread gets its own database connections, which would
+            # otherwise never be closed.
+            connections.close_all()
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    return thread
+
+
+def _get_or_revalidate(key, fetch, timeout, stale_timeout, default=None):
+    """
+    Return the entry cached under ``key`` and keep it up to date with
+    ``fetch``, following a stale-while-revalidate strategy.
+
+    * A value younger than ``timeout`` seconds is returned as is.
+    * A value older than ``timeout`` seconds, but younger than ``timeout`` +
+      ``stale_timeout`` seconds, is returned immediately while it is refreshed
+      in the background. Only one worker refreshes the value at a time and if
+      the refresh fails, the stale value is kept.
+    * Without a cached value, one worker calls ``fetch`` directly and any
+      exception is raised. The other workers wait up to ``COLD_CACHE_WAIT``
+      seconds for its value, and return ``default`` if it's not there in time.
+
+    :param key: The cache key.
+    :param fetch: Callable that returns the value to cache. It receives the
+        cached value when it's refreshed, or ``None``, to check whether the
+        value changed.
+    :param timeout: The number of seconds the value is considered fresh.
+    :param stale_timeout: The number of seconds a stale value can be served.
+    :param default: The value to return when waiting for another worker takes
+        too long.
+    :return: A ``(value, fetched_at)`` tuple, where ``fetched_at`` is the
+        timestamp of the fetch, or ``None`` for the ``default``.
+    """
+    entry = get_cache().get(key)
+    if entry is None:
+        return _fill(key, fetch, timeout, stale_timeout, default)
+
+    value, fetched_at = entry
+    if time.time() - fetched_at >= timeout:
+        # The lock expires by itself in case the refreshing worker dies.
+        if get_cache().add(f"{key}__lock", True, timeout=max(timeout, 1)):
+            run_in_background(
+                lambda: _revalidate(key, fetch, timeout, stale_timeout, value)
+            )
+
+    return entry
+
+
+def _fill(key, fetch, timeout, stale_timeout, default):
+    cache = get_cache()
+    deadline = time.monotonic() + COLD_CACHE_WAIT
+    while True:
+        if cache.add(f"{key}__lock", True, timeout=max(timeout, 1)):
+            try:
+                return _refresh(key, fetch, timeout, stale_timeout)
+            finally:
+                cache.delete(f"{key}__lock")
+
+        if time.monotonic() >= deadline:
+            return (default, None)
+
+        time.sleep(COLD_CACHE_POLL_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry
+
+
+def _refresh(key, fetch, timeout, stale_timeout, previous=None):
+    entry = (fetch(previous), time.time())
+    get_cache().set(key, entry, timeout=timeout + stale_timeout)
+    return entry
+
+
+def _revalidate(key, fetch, timeout, stale_timeout, previous):
+    try:
+        _refresh(key, fetch, timeout, stale_timeout, previous)
+    except Exception as exc:
+        logger.exception(exc)
+    finally:
+        get_cache().delete(f"{key}__lock")
+
+
+class CachedForms(NamedTuple):
+    forms: List[FormSummary]
+    # The validators of the response with the forms, to only retrieve them
+    # again if they changed.
+    validators: Optional[Validators]
+
+
+def get_forms_cache_key() -> str:
+    """
+    Return the cache key of the forms of the current configuration.
+
+    Forms retrieved with an earlier configuration, for example by a refresh
+    that was still running when the configuration was saved, are stored under
+    the key of that configuration and never used again.
+    """
+    from .snapshot import get_configuration_version
+
+    return f"{FORMS_CACHE_KEY}.{get_configuration_version()}"
+
+
+def get_cached_forms():
+    """
+    Return the forms from the Open Forms API via the shared cache.
+
+    :returns: The forms as :class:`openformsclient.summary.FormSummary`, or an
+        empty list if the configuration is incomplete or another worker takes
+        too long to retrieve them.
+    """
+    cached_forms, fetched_at = _get_cached_forms_entry()
+    return cached_forms.forms
+
+
+def get_form_index() -> FormIndex:
+    """
+    Return the index of the forms in the shared cache.
+
+    The index is built once per process for every retrieval of the forms.
+    """
+    global _form_index
+
+    cached_forms, fetched_at = _get_cached_forms_entry()
+
+    form_index = _form_index
+    if form_index is None or form_index[0] != fetched_at:
+        form_index = _form_index = (fetched_at, FormIndex(cached_forms.forms))
+    return form_index[1]
+
+
+def warm_form_cache():
+    """
+    Retrieve the forms from the Open Forms API and store them in the shared
+    cache, regardless of whether they are cached already. The index and the
+    choices for UUID and slug fields are built as well.
+
+    :returns: The forms as :class:`openformsclient.summary.FormSummary`.
+    """
+    _refresh(
+        get_forms_cache_key(),
+        _fetch_forms,
+        timeout=get_setting("FORMS_CACHE_TIMEOUT"),
+        stale_timeout=get_setting("FORMS_CACHE_STALE_TIMEOUT"),
+    )
+
+    form_index = get_form_index()
+    form_index.get_choices(use_uuids=True)
+    form_index.get_choices(use_uuids=False)
+
+    return get_cached_forms()
+
+
+def _fetch_forms(previous=None):
+    from .snapshot import get_configuration_snapshot
+
+    client = get_configuration_snapshot().client
+    if not client.has_config():
+        return CachedForms([], None)
+
+    # The forms are only retrieved again if they changed.
+    forms, validators = client.get_form_summaries_if_modified(
+        validators=previous.validators if previous else None,
+        stream=get_setting("STREAM_FORMS"),
+    )
+    if forms is None:
+        forms = previous.forms
+    return CachedForms(forms, validators)
+
+
+def _get_cached_forms_entry():
+    return _get_or_revalidate(
+        get_forms_cache_key(),
+        _fetch_forms,
+        timeout=get_setting("FORMS_CACHE_TIMEOUT"),
+        stale_timeout=get_setting("FORMS_CACHE_STALE_TIMEOUT"),
+        default=CachedForms([], None),
+    )
+
+
+class HealthStatus(NamedTuple):
+    healthy: bool
+    message: str
+    # The time of the check, as a Unix timestamp.
+    checked_at: float
+    # The duration of the check, in seconds.
+    latency: float
+
+
+def get_health_status() -> Optional[HealthStatus]:
+    """
+    Return the last known health status of the Open Forms API without waiting
+    for it.
+
+    If the status is older than ``OPENFORMSCLIENT_HEALTH_CACHE_TIMEOUT``
+    seconds, or unknown, it is checked in the background.
+
+    :returns: The last known status, or ``None`` if it's not known yet.
+    """
+    status = get_cache().get(HEALTH_CACHE_KEY)
+
+    timeout = get_setting("HEALTH_CACHE_TIMEOUT")
+    if status is None or time.time() - status.checked_at >= timeout:
+        if get_cache().add(f"{HEALTH_CACHE_KEY}__lock", True, timeout=max(timeout, 1)):
+            run_in_background(_revalidate_health_status)
+
+    return status
+
+
+def check_health_status() -> HealthStatus:
+    """
+    Check the health of the Open Forms API and store the result in the cache.
+    """
+    from .snapshot import get_configuration_snapshot
+
+    client = get_configuration_snapshot().client
+
+    start = time.monotonic()
+    healthy, message = client.is_healthy()
+    status = HealthStatus(
+        healthy=healthy,
+        message=message,
+        checked_at=time.time(),
+        latency=time.monotonic() - start,
+    )
+
+    timeout = get_setting("HEALTH_CACHE_TIMEOUT")
+    stale_timeout = get_setting("HEALTH_CACHE_STALE_TIMEOUT")
+    get_cache().set(HEALTH_CACHE_KEY, status, timeout=timeout + stale_timeout)
+    return status
+
+
+def _revalidate_health_status():
+    try:
+        check_health_status()
+    except Exception as exc:
+        logger.exception(exc)
+    finally:
+        get_cache().delete(f"{HEALTH_CACHE_KEY}__lock")
+
+
+def clear_health_status():
+    get_cache().delete(HEALTH_CACHE_KEY)
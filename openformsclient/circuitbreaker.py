@@ -0,0 +1,89 @@
+import threading
+import time
+
+from requests.exceptions import ConnectionError
+
+
+class CircuitOpenError(ConnectionError):
+    """
+    Raised instead of doing a request while the circuit is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Track consecutive failures of requests to the Open Forms API, and make
+    requests fail fast while the API seems to be unavailable.
+
+    After ``failure_threshold`` consecutive failures, the circuit opens and
+    requests fail immediately with a :class:`CircuitOpenError`. After
+    ``recovery_timeout`` seconds, the circuit is half-open and a single request
+    is let through to probe the API. If it succeeds, the circuit is closed
+    again, otherwise it's opened for another ``recovery_timeout`` seconds.
+
+    :param failure_threshold: The number of consecutive failures to open the
+        circuit, or ``0`` to never open the circuit.
+    :param recovery_timeout: The number of seconds the circuit stays open.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._get_state()
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    def _get_state(self):
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.recovery_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def before_request(self):
+        """
+        Raise a :class:`CircuitOpenError` if no request should be done.
+        """
+        if not self.failure_threshold:
+            return
+
+        with self._lock:
+            state = self._get_state()
+            if state == self.OPEN or (state == self.HALF_OPEN and self._probing):
+                remaining = self.recovery_timeout - (time.monotonic() - self._opened_at)
+                raise CircuitOpenError(
+                    f"The Open Forms API is unavailable after {self._failures} "
+                    f"failed requests. Retrying in {max(remaining, 0):.0f} seconds."
+                )
+            if state == self.HALF_OPEN:
+                self._probing = True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if not self.failure_threshold:
+                return
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
@@ -1,29 +1,224 @@
 import logging
-from typing import Tuple
-from urllib.parse import urljoin
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit
 
 import requests
-from requests.exceptions import HTTPError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, HTTPError, InvalidURL, Timeout
+
+from .circuitbreaker import CircuitBreaker, CircuitOpenError
+from .lru import LRUCache
+from .streaming import iter_projected_items
+from .summary import FormSummary
 
 logger = logging.getLogger(__name__)
 
+# Only requests that can be safely repeated are retried.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+# Responses that indicate Open Forms is temporarily unavailable.
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_next_page_url(api_root, next_url) -> str:
+    """
+    Return the link to the next page of a paginated response, with the scheme
+    and host of the API root.
+
+    Open Forms behind a proxy can link to the next page with another scheme
+    or port. The API token is sent along with the request, so it must never go
+    over plain HTTP, or to another host.
+
+    :raises InvalidURL: If the link is on another host than the API root.
+    """
+    root = urlsplit(api_root)
+    url = urlsplit(urljoin(api_root, next_url))
+    if url.hostname != root.hostname:
+        raise InvalidURL(
+            f"The next page {next_url} is not on the host of the API root "
+            f"{api_root}."
+        )
+    return urlunsplit((root.scheme, root.netloc, url.path, url.query, ""))
+
+
+class Validators(NamedTuple):
+    """
+    The ``ETag`` and ``Last-Modified`` headers of a response, to retrieve it
+    again only if it changed.
+    """
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    @classmethod
+    def from_response(cls, response) -> Optional["Validators"]:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return None
+        return cls(etag, last_modified)
+
+    def as_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
 
 class Client:
-    def __init__(self, api_root, api_token, client_timeout):
+    def __init__(
+        self,
+        api_root,
+        api_token,
+        client_timeout,
+        connect_timeout=None,
+        read_timeout=None,
+        deadline=None,
+        max_retries=0,
+        retry_backoff=0.5,
+        pool_connections=10,
+        pool_maxsize=10,
+        form_cache_size=512,
+        form_cache_timeout=60,
+        max_workers=4,
+        failure_threshold=5,
+        recovery_timeout=30,
+    ):
         self.api_root = api_root
         self.api_token = api_token
-        self.timeout = client_timeout
+        self.timeout = (
+            connect_timeout or client_timeout,
+            read_timeout or client_timeout,
+        )
+        self.deadline = deadline
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # Forms by UUID or slug, with the validators of their response and the
+        # (monotonic) time they were retrieved. Outdated forms are kept to
+        # retrieve them again with a conditional request.
+        self._form_details = LRUCache(maxsize=form_cache_size)
+        self.form_cache_timeout = form_cache_timeout
+        self.max_workers = max_workers
+
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=failure_threshold, recovery_timeout=recovery_timeout
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The HTTP session that keeps connections to Open Forms alive.
+
+        The session is created on first use and shared by all threads that use
+        this client.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        # Open Forms sets session and CSRF cookies which should not leak from
+        # one request into another, since the session is shared.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self):
+        """
+        Close the HTTP session and all its pooled connections.
+        """
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _request(self, method, relative_url, headers=None, **extra_kwargs):
+        """
+        Do a request to the Open Forms API.
 
-    def _request(self, method, relative_url, **extra_kwargs):
+        Requests that can be safely repeated are retried on connection errors,
+        timeouts and unavailability of Open Forms, with an exponential backoff.
+        All attempts together take approximately at most ``deadline`` seconds.
+        """
         kwargs = {
-            "headers": {"Authorization": f"Token {self.api_token}"},
-            "timeout": self.timeout,
+            "headers": {"Authorization": f"Token {self.api_token}", **(headers or {})},
         }
         kwargs.update(extra_kwargs)
 
-        response = requests.request(
-            method, urljoin(self.api_root, relative_url), **kwargs
-        )
+        url = urljoin(self.api_root, relative_url)
+        retries = self.max_retries if method.upper() in IDEMPOTENT_METHODS else 0
+        deadline = time.monotonic() + self.deadline if self.deadline else None
+
+        attempt = 0
+        while True:
+            timeout = self.timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Timeout(
+                        f"No response from {url} within {self.deadline} seconds."
+                    )
+                timeout = tuple(min(t, remaining) for t in self.timeout)
+
+            try:
+                response = self._send(method, url, timeout=timeout, **kwargs)
+            except CircuitOpenError:
+                raise
+            except (ConnectionError, Timeout):
+                if attempt >= retries:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= retries:
+                    return response
+                # Release the connection back to the pool.
+                response.close()
+
+            backoff = self.retry_backoff * 2**attempt
+            if deadline is not None and time.monotonic() + backoff >= deadline:
+                raise Timeout(f"No response from {url} within {self.deadline} seconds.")
+
+            attempt += 1
+            logger.info("Retrying request to %s (attempt %d).", url, attempt + 1)
+            time.sleep(backoff)
+
+    def _send(self, method, url, **kwargs):
+        self.circuit_breaker.before_request()
+
+        # Client errors mean Open Forms is available, only connection errors,
+        # timeouts and server errors count as failures.
+        failed = True
+        try:
+            response = self.session.request(method, url, **kwargs)
+            failed = response.status_code >= 500
+        finally:
+            if failed:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
 
         return response
 
@@ -50,6 +245,8 @@ class Client:
                 )
             except Exception:
                 message = f"Server did not return a valid response (HTTP {e.response.status_code})."
+        except CircuitOpenError as e:
+            message = str(e)
         except Exception as e:
             logger.exception(e)
             message = str(e)
@@ -60,21 +257,294 @@ class Client:
         """
         Retrieve all available forms in Open Forms API.
 
-        :returns: The API response content as Python object.
+        If the API paginates the forms, all pages are retrieved.
+
+        :returns: The forms in the API response content as Python object.
         """
-        response = self._request("get", "public/forms")
-        response.raise_for_status()
+        return self._get_remaining_forms(self._get_json("public/forms"))
 
-        return response.json()
+    def _get_remaining_forms(self, data) -> list:
+        """
+        Return the forms of the response content ``data`` and, if the forms
+        are paginated, of all next pages.
+        """
+        forms = []
+        while True:
+            # The response is either a list of forms, or a paginated response.
+            if isinstance(data, dict):
+                forms += data["results"]
+                url = data.get("next")
+            else:
+                forms += data
+                url = None
+
+            if not url:
+                return forms
+            data = self._get_json(get_next_page_url(self.api_root, url))
+
+    def iter_forms(
+        self, fields: Iterable[str] = FormSummary.API_FIELDS, prefetch: bool = False
+    ) -> Iterator[dict]:
+        """
+        Retrieve all available forms in Open Forms API, and yield each form with
+        only the given fields.
+
+        The response is streamed and, if ``ijson`` is installed, parsed
+        incrementally. This keeps the memory usage low for large numbers of
+        forms. If the API paginates the forms, the next page is only retrieved
+        once the forms of the current page are consumed.
+
+        :param fields: The fields to keep of each form.
+        :param prefetch: Retrieve the next page in the background, as soon as
+            its link is known.
+        """
+        yield from self._iter_forms(self._get_page("public/forms"), fields, prefetch)
+
+    def _iter_forms(self, response, fields, prefetch, pages=None):
+        """
+        Yield the forms of the streamed ``response`` and of all next pages.
+
+        :param pages: A list to add the metadata of every page to.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while response is not None:
+                metadata = {}
+                if pages is not None:
+                    pages.append(metadata)
+                next_response = None
+                try:
+                    with response:
+                        for form in iter_projected_items(
+                            response.raw, fields, metadata
+                        ):
+                            if (
+                                prefetch
+                                and next_response is None
+                                and metadata.get("next")
+                            ):
+                                next_response = executor.submit(
+                                    self._get_page,
+                                    get_next_page_url(self.api_root, metadata["next"]),
+                                )
+                            yield form
+                except BaseException:
+                    # Also close the prefetched page if the forms are not
+                    # consumed entirely.
+                    if next_response is not None:
+                        next_response.add_done_callback(_close_response)
+                    raise
+
+                if next_response is not None:
+                    response = next_response.result()
+                elif metadata.get("next"):
+                    response = self._get_page(
+                        get_next_page_url(self.api_root, metadata["next"])
+                    )
+                else:
+                    response = None
+
+    def get_form_summaries(self, stream: bool = False) -> List[FormSummary]:
+        """
+        Retrieve all available forms in Open Forms API, as summaries.
+
+        :param stream: Stream the response, see ``iter_forms``.
+        """
+        forms, validators = self.get_form_summaries_if_modified(stream=stream)
+        return forms
+
+    def get_form_summaries_if_modified(
+        self, validators: Optional[Validators] = None, stream: bool = False
+    ) -> Tuple[Optional[List[FormSummary]], Optional[Validators]]:
+        """
+        Retrieve all available forms in Open Forms API, as summaries, if they
+        changed since they were retrieved with ``validators``.
+
+        Paginated forms are always retrieved, since only the first page could be
+        checked for changes.
+
+        :param validators: The validators returned with the forms before.
+        :param stream: Stream the response, see ``iter_forms``.
+        :returns: The forms, or ``None`` if they didn't change, and the
+            validators to pass next time.
+        """
+        headers = validators.as_headers() if validators else None
+
+        if stream:
+            response = self._get_page("public/forms", headers=headers)
+            if response.status_code == 304:
+                response.close()
+                return None, validators
+
+            validators = Validators.from_response(response)
+            pages = []
+            forms = self._iter_forms(
+                response, FormSummary.API_FIELDS, prefetch=True, pages=pages
+            )
+            summaries = [FormSummary.from_api(form) for form in forms]
+            if len(pages) > 1:
+                validators = None
+        else:
+            response = self._request("get", "public/forms", headers=headers)
+            if response.status_code == 304:
+                return None, validators
+
+            response.raise_for_status()
+            validators = Validators.from_response(response)
+            data = response.json()
+            if isinstance(data, dict) and data.get("next"):
+                validators = None
+            forms = self._get_remaining_forms(data)
+            summaries = [FormSummary.from_api(form) for form in forms]
+
+        return summaries, validators
+
+    def _get_page(self, url, headers=None):
+        response = self._request("get", url, headers=headers, stream=True)
+        try:
+            response.raise_for_status()
+        except HTTPError:
+            response.close()
+            raise
+        response.raw.decode_content = True
+        return response
 
     def get_form(self, uuid_or_slug: str) -> dict:
         """
         Retrieve a specific form from the Open Forms API.
 
+        If the form was retrieved before, it's only retrieved again if it
+        changed. The returned form should not be modified, since it can be
+        shared with later calls.
+
         :param uuid_or_slug: The UUID or the slug that identifies the form.
         :returns: The API response content as Python object.
         """
-        response = self._request("get", f"forms/{uuid_or_slug}")
-        response.raise_for_status()
+        cached = self._form_details.get(uuid_or_slug)
+        validators = cached[1] if cached else None
+
+        response = self._request(
+            "get",
+            f"forms/{uuid_or_slug}",
+            headers=validators.as_headers() if validators else None,
+        )
+        if validators is not None and response.status_code == 304:
+            form = cached[0]
+        else:
+            try:
+                response.raise_for_status()
+            except HTTPError:
+                self._form_details.delete(uuid_or_slug)
+                raise
+            form = response.json()
+            validators = Validators.from_response(response)
+
+        self._form_details.set(uuid_or_slug, (form, validators, time.monotonic()))
+        return form
 
+    def _get_json(self, relative_url):
+        response = self._request("get", relative_url)
+        response.raise_for_status()
         return response.json()
+
+    def get_forms_by_ids(
+        self, ids: Iterable[str], use_index: bool = True
+    ) -> Dict[str, Optional[dict]]:
+        """
+        Retrieve multiple forms from the Open Forms API.
+
+        Forms are cached for a short while, by UUID, and retrieved again with a
+        conditional request after that. The cached list of forms
+        of the configuration (see :func:`openformsclient.cache.get_form_index`)
+        is used to find the UUID of a slug, so a form is only retrieved once
+        for both. Forms that are not cached are retrieved concurrently, with at
+        most ``max_workers`` requests at the same time.
+
+        :param ids: The UUIDs and/or slugs that identify the forms.
+        :param use_index: Look up the UUIDs of slugs in the cached list of
+            forms. It's only used if this client connects to the configured
+            Open Forms API.
+        :returns: The API response content as Python object, by UUID or slug.
+            Forms that do not exist are ``None``.
+        """
+        form_index = self._get_form_index() if use_index else None
+
+        results = {}
+        # The UUIDs and/or slugs to retrieve, with the ids they were asked by.
+        missing = {}
+        for uuid_or_slug in dict.fromkeys(ids):
+            summary = form_index.get(uuid_or_slug) if form_index else None
+            key = summary.uuid if summary else uuid_or_slug
+
+            cached = self._form_details.get(key)
+            if cached and time.monotonic() - cached[2] < self.form_cache_timeout:
+                results[uuid_or_slug] = cached[0]
+            else:
+                missing.setdefault(key, []).append(uuid_or_slug)
+
+        if missing:
+            workers = min(self.max_workers, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                forms = executor.map(self._get_form_or_none, missing)
+                for key, form in zip(missing, forms):
+                    results.update(dict.fromkeys(missing[key], form))
+
+        return results
+
+    def _get_form_index(self):
+        from .cache import get_form_index
+        from .snapshot import get_configuration_snapshot
+
+        if get_configuration_snapshot().api_root != self.api_root:
+            return None
+
+        try:
+            return get_form_index()
+        except Exception as exc:
+            # The forms can still be retrieved one by one.
+            logger.exception(exc)
+            return None
+
+    def _get_form_or_none(self, uuid_or_slug):
+        try:
+            return self.get_form(uuid_or_slug)
+        except HTTPError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+
+def _close_response(future):
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def get_client(api_root, api_token, client_timeout, **options) -> Client:
+    """
+    Return the process-wide client for the given configuration.
+
+    Clients are registered on the configuration fingerprint (all arguments), so
+    connection pools and other client state survive across requests. When the
+    configuration changes, a new client is created and the old one is dropped.
+    """
+    fingerprint = (api_root, api_token, client_timeout, tuple(sorted(options.items())))
+
+    client = _clients.get(fingerprint)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(fingerprint)
+            if client is None:
+                client = Client(api_root, api_token, client_timeout, **options)
+                # There is only one configuration, so any other client is
+                # outdated. Those clients are not closed explicitly since they
+                # might still be in use by another thread.
+                _clients.clear()
+                _clients[fingerprint] = client
+    return client
+
+
+def clear_clients():
+    """
+    Remove all clients from the process-wide registry.
+    """
+    with _clients_lock:
+        _clients.clear()
@@ -0,0 +1,240 @@
+import heapq
+import re
+import sys
+import unicodedata
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .summary import FormSummary
+
+# Splits names and slugs in words for the prefix search.
+WORD_SEPARATOR = re.compile(r"[\W_]+")
+
+
+def normalize(text: str) -> str:
+    """
+    Return ``text`` without accents and case, to compare and sort texts the
+    way people expect, for example "École" between "ebook" and "Eend".
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    ).casefold()
+
+
+def sort_key(text: str) -> Tuple[str, str]:
+    """
+    Return the key to sort ``text`` by, ignoring accents and case. Texts that
+    only differ in accents or case are sorted by their exact value.
+    """
+    return (normalize(text), text)
+
+
+class FormIndex:
+    """
+    Lookup table of forms by UUID and slug, built from a list of forms.
+
+    The forms are sorted by name and indexed for :meth:`search` once, when the
+    index is built.
+
+    :param forms: The forms, as returned by ``Client.get_form_summaries``.
+    """
+
+    def __init__(self, forms: Iterable[FormSummary]):
+        self._by_uuid = {}
+        self._by_slug = {}
+        self._choices = {}
+
+        for form in forms:
+            self._by_uuid[form.uuid] = form
+            self._by_slug[form.slug] = form
+
+        keyed = sorted(
+            ((sort_key(form.name), form) for form in self._by_uuid.values()),
+            key=lambda entry: entry[0],
+        )
+        self._sorted = [form for _key, form in keyed]
+        self._search_texts = [f"{key[0]} {normalize(form.slug)}" for key, form in keyed]
+
+        # The words of every form, and the sorted list of all words with the
+        # sorted positions of the forms they occur in, to find words by prefix
+        # with a binary search.
+        self._form_words = []
+        positions_by_word = {}
+        for position, text in enumerate(self._search_texts):
+            words = tuple(
+                word for word in dict.fromkeys(WORD_SEPARATOR.split(text)) if word
+            )
+            self._form_words.append(words)
+            for word in words:
+                positions_by_word.setdefault(word, []).append(position)
+        self._words = sorted(positions_by_word)
+        self._word_positions = [positions_by_word[word] for word in self._words]
+        # The number of positions of all words before every word, to count the
+        # positions of a range of words at once.
+        self._position_counts = [0]
+        for positions in self._word_positions:
+            self._position_counts.append(self._position_counts[-1] + len(positions))
+
+        # All texts in one string, with the offset of every text, to search for
+        # a substring in all texts at once.
+        self._haystack = "\n".join(self._search_texts)
+        self._offsets = []
+        offset = 0
+        for text in self._search_texts:
+            self._offsets.append(offset)
+            offset += len(text) + 1
+
+    def __len__(self):
+        return len(self._by_uuid)
+
+    def __iter__(self) -> Iterator[FormSummary]:
+        return iter(self._by_uuid.values())
+
+    def get(self, uuid_or_slug) -> Optional[FormSummary]:
+        """
+        Return the form identified by the UUID or the slug, or ``None`` if it's
+        unknown.
+        """
+        key = str(uuid_or_slug)
+        return self._by_uuid.get(key) or self._by_slug.get(key)
+
+    def slug_to_uuid(self, slug: str) -> Optional[str]:
+        entry = self._by_slug.get(slug)
+        return entry.uuid if entry else None
+
+    def uuid_to_slug(self, uuid) -> Optional[str]:
+        entry = self._by_uuid.get(str(uuid))
+        return entry.slug if entry else None
+
+    def name_for(self, uuid_or_slug) -> Optional[str]:
+        entry = self.get(uuid_or_slug)
+        return entry.name if entry else None
+
+    def get_choices(self, use_uuids=False, blank_choice=None) -> List[Tuple[str, str]]:
+        """
+        Return the form choices, sorted by name, ignoring accents and case.
+
+        The choices are built once per index and should not be modified.
+
+        :param use_uuids: Use the form UUID as choice value instead of the slug.
+        :param blank_choice: The choices to prepend if there are any forms, like
+            ``[("", "---------")]``.
+        """
+        key = (use_uuids, tuple(blank_choice) if blank_choice else None)
+        if key not in self._choices:
+            field = "uuid" if use_uuids else "slug"
+            choices = [(getattr(form, field), form.name) for form in self._sorted]
+            if choices and blank_choice:
+                choices = list(blank_choice) + choices
+            self._choices[key] = choices
+        return self._choices[key]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[FormSummary]:
+        """
+        Return the forms of which the name or slug matches ``query``, ignoring
+        accents and case, sorted by name.
+
+        Forms of which a word starts with every word in the query come first,
+        followed by forms that contain the query anywhere in their name or
+        slug.
+
+        :param query: The text to search for.
+        :param limit: The maximum number of forms to return.
+        """
+        query = normalize(query).strip()
+        if not query:
+            return self._sorted[:limit]
+
+        results = []
+        terms = [term for term in WORD_SEPARATOR.split(query) if term]
+        if terms:
+            results = self._prefix_matches(terms, limit)
+
+        if limit is None or len(results) < limit:
+            results += self._substring_matches(query, set(results), limit)
+
+        return [self._sorted[position] for position in results[:limit]]
+
+    def _prefix_matches(self, terms: List[str], limit: Optional[int]) -> List[int]:
+        """
+        Return the positions of the forms of which a word starts with every
+        term, in order, up to ``limit``.
+        """
+        if not self._sorted:
+            return []
+
+        ranges = [self._prefix_range(term) for term in terms]
+        counts = [
+            self._position_counts[end] - self._position_counts[start]
+            for start, end in ranges
+        ]
+        # The forms with a word for the term with the fewest forms are checked
+        # for the other terms.
+        index = min(range(len(terms)), key=counts.__getitem__)
+        start, end = ranges[index]
+
+        # The share of the forms that is expected to match.
+        share = 1.0
+        for count in counts:
+            share *= count / len(self._sorted)
+
+        if limit is not None and limit < share * counts[index]:
+            # Many forms match, so they're found sooner by checking all forms
+            # in order.
+            candidates = range(len(self._sorted))
+        else:
+            candidates = heapq.merge(*self._word_positions[start:end])
+            terms = terms[:index] + terms[index + 1 :]
+
+        matches = []
+        previous = None
+        for position in candidates:
+            # A form can have multiple words with the prefix.
+            if position == previous:
+                continue
+            previous = position
+
+            words = self._form_words[position]
+            if all(any(word.startswith(term) for word in words) for term in terms):
+                matches.append(position)
+                if len(matches) == limit:
+                    break
+        return matches
+
+    def _prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """
+        Return the start and end index of the words that start with ``prefix``.
+        """
+        start = bisect_left(self._words, prefix)
+        if ord(prefix[-1]) == sys.maxunicode:
+            return start, len(self._words)
+
+        # The first word after the words with the prefix.
+        following = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return start, bisect_left(self._words, following, start)
+
+    def _substring_matches(
+        self, query: str, skip: set, limit: Optional[int]
+    ) -> List[int]:
+        """
+        Return the positions of the forms that contain ``query`` and are not in
+        ``skip``, in order, up to ``limit`` forms in total with ``skip``.
+        """
+        if "\n" in query:
+            # A match could span multiple texts.
+            return []
+
+        matches = []
+        offset = self._haystack.find(query)
+        while offset != -1:
+            position = bisect_right(self._offsets, offset) - 1
+            if position not in skip:
+                matches.append(position)
+                if limit is not None and len(matches) + len(skip) >= limit:
+                    break
+            # Continue with the next form.
+            if position + 1 == len(self._offsets):
+                break
+            offset = self._haystack.find(query, self._offsets[position + 1])
+        return matches
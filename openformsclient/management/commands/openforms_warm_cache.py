@@ -0,0 +1,37 @@
+import pickle
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.template.defaultfilters import filesizeformat
+
+from ...cache import is_shared_cache, warm_form_cache
+from ...settings import get_setting
+
+
+class Command(BaseCommand):
+    help = "Retrieve the forms from Open Forms and store them in the cache."
+
+    def handle(self, **options):
+        # The forms in a local memory cache would be gone when this command
+        # exits.
+        if not is_shared_cache():
+            raise CommandError(
+                f"The cache {get_setting('CACHE_ALIAS')!r} is not shared with "
+                "other processes. Set OPENFORMSCLIENT_CACHE_ALIAS to a cache "
+                "like Redis or Memcached to warm it."
+            )
+
+        start = time.monotonic()
+        try:
+            forms = warm_form_cache()
+        except Exception as exc:
+            raise CommandError(f"Could not retrieve the forms: {exc}") from exc
+        duration = time.monotonic() - start
+
+        size = len(pickle.dumps(forms, protocol=pickle.HIGHEST_PROTOCOL))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Cached {len(forms)} forms ({filesizeformat(size)}) "
+                f"in {duration:.2f} seconds."
+            )
+        )
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.30 on 2026-10-18 08:00
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("openformsclient", "0003_configuration_client_timeout"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="configuration",
+            name="connect_timeout",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="The timeout to connect to Open Forms (in seconds). Defaults to the client request timeout.",
+                null=True,
+                verbose_name="Connect timeout",
+            ),
+        ),
+        migrations.AddField(
+            model_name="configuration",
+            name="max_retries",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="The number of times a request that can be safely repeated is retried on connection errors, timeouts and unavailability of Open Forms.",
+                verbose_name="Maximum retries",
+            ),
+        ),
+        migrations.AddField(
+            model_name="configuration",
+            name="read_timeout",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="The timeout to wait for a response from Open Forms (in seconds). Defaults to the client request timeout.",
+                null=True,
+                verbose_name="Read timeout",
+            ),
+        ),
+        migrations.AddField(
+            model_name="configuration",
+            name="request_deadline",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="The maximum total duration of a request, including retries (in seconds). Leave empty for no limit.",
+                null=True,
+                verbose_name="Request deadline",
+            ),
+        ),
+        migrations.AddField(
+            model_name="configuration",
+            name="retry_backoff",
+            field=models.FloatField(
+                default=0.5,
+                help_text="The waiting time before the first retry (in seconds), which is doubled for each next retry.",
+                validators=[django.core.validators.MinValueValidator(0)],
+                verbose_name="Retry backoff factor",
+            ),
+        ),
+    ]
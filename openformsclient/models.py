@@ -1,18 +1,19 @@
 import logging
 
-from django.core.cache import cache
-from django.db import models
+from django.core.validators import MinValueValidator
+from django.db import models, transaction
 from django.db.models.fields import BLANK_CHOICE_DASH
 from django.forms.fields import TypedChoiceField
-from django.forms.widgets import Select
-from django.utils.functional import cached_property, lazy
+from django.utils.functional import lazy
 from django.utils.text import capfirst
 from django.utils.translation import gettext_lazy as _
 
 from solo.models import SingletonModel
 
-from .client import Client
-from .utils import get_form_choices
+from .cache import get_form_index
+from .settings import get_setting
+from .snapshot import ConfigurationSnapshot, bump_configuration_version
+from .widgets import OpenFormsAutocompleteWidget, OpenFormsSelect
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,51 @@ class Configuration(SingletonModel):
         default=5,
         help_text=_("The timeout that is used for requests (in seconds)"),
     )
+    connect_timeout = models.PositiveIntegerField(
+        _("Connect timeout"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "The timeout to connect to Open Forms (in seconds). Defaults to the "
+            "client request timeout."
+        ),
+    )
+    read_timeout = models.PositiveIntegerField(
+        _("Read timeout"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "The timeout to wait for a response from Open Forms (in seconds). "
+            "Defaults to the client request timeout."
+        ),
+    )
+    request_deadline = models.PositiveIntegerField(
+        _("Request deadline"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "The maximum total duration of a request, including retries (in "
+            "seconds). Leave empty for no limit."
+        ),
+    )
+    max_retries = models.PositiveIntegerField(
+        _("Maximum retries"),
+        default=0,
+        help_text=_(
+            "The number of times a request that can be safely repeated is "
+            "retried on connection errors, timeouts and unavailability of Open "
+            "Forms."
+        ),
+    )
+    retry_backoff = models.FloatField(
+        _("Retry backoff factor"),
+        default=0.5,
+        validators=[MinValueValidator(0)],
+        help_text=_(
+            "The waiting time before the first retry (in seconds), which is "
+            "doubled for each next retry."
+        ),
+    )
 
     sdk_css_url = models.URLField(
         _("SDK CSS URL"),
@@ -74,11 +120,52 @@ class Configuration(SingletonModel):
     def save(self, *args, **kwargs):
         if not self.api_root.endswith("/"):
             self.api_root += "/"
-        return super().save(*args, **kwargs)
+        result = super().save(*args, **kwargs)
+
+        # Processes that take a snapshot before the transaction is committed
+        # would keep the old configuration, so the version is changed again
+        # after the commit.
+        bump_configuration_version()
+        transaction.on_commit(bump_configuration_version)
+        return result
 
-    @cached_property
+    @property
     def client(self):
-        return Client(self.api_root, self.api_token, self.client_timeout)
+        return ConfigurationSnapshot.from_configuration(self).client
+
+    @property
+    def async_client(self):
+        """
+        The async client, which can only be used in a running event loop.
+        """
+        return ConfigurationSnapshot.from_configuration(self).async_client
+
+
+class FormDescriptor:
+    """
+    Provide the form (uuid, slug and name) referenced by an Open Forms field, on
+    model instances.
+
+    The form is looked up in the cached index of forms, or ``None`` if the
+    form is unknown.
+    """
+
+    def __init__(self, field):
+        self.field = field
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+
+        value = getattr(instance, self.field.attname)
+        if not value:
+            return None
+
+        try:
+            return get_form_index().get(value)
+        except Exception as exc:
+            logger.exception(exc)
+            return None
 
 
 class OpenFormsBaseField:
@@ -87,12 +174,17 @@ class OpenFormsBaseField:
     the available forms (uuid, name) or (slug, name) in Open Forms.
 
     This form records the form's UUID or slug, depending on what concrete model
-    class is used.
+    class is used. The referenced form is available on model instances as
+    ``<field name>_form``.
     """
 
     description = _("Open Forms form")
     use_uuids = None
 
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super().contribute_to_class(cls, name, *args, **kwargs)
+        setattr(cls, f"{self.name}_form", FormDescriptor(self))
+
     def deconstruct(self):
         name, path, args, kwargs = super().deconstruct()
         # We do not exclude max_length if it matches default as we want to change
@@ -100,11 +192,16 @@ class OpenFormsBaseField:
         return name, path, args, kwargs
 
     def formfield(self, **kwargs):
+        if get_setting("AUTOCOMPLETE"):
+            widget = OpenFormsAutocompleteWidget(use_uuids=self.use_uuids)
+        else:
+            widget = OpenFormsSelect
+
         defaults = {
             "required": not self.blank,
             "label": capfirst(self.verbose_name),
             "help_text": self.help_text,
-            "widget": Select,
+            "widget": widget,
         }
 
         defaults["choices"] = self.get_choices(include_blank=self.blank)
@@ -120,24 +217,15 @@ class OpenFormsBaseField:
         ordering=(),
     ):
         def _fetch():
-            cache_key = f"openformsclient.models.OpenFormsBaseField.get_choices__use_uuids_{self.use_uuids}"
-
-            choices = cache.get(cache_key)
-            if choices is None:
-                try:
-                    choices = get_form_choices(use_uuids=self.use_uuids)
-                except Exception as exc:
-                    logger.exception(exc)
-                    choices = []
-                else:
-                    cache.set(cache_key, choices, timeout=60)
-
-            if choices:
-                if include_blank:
-                    blank_defined = any(choice in ("", None) for choice, _ in choices)
-                    if not blank_defined:
-                        choices = blank_choice + choices
-            return choices
+            # The choices are built once per retrieval of the forms, and
+            # shared by all fields, like the rows of an admin inline.
+            try:
+                return get_form_index().get_choices(
+                    self.use_uuids, blank_choice=blank_choice if include_blank else None
+                )
+            except Exception as exc:
+                logger.exception(exc)
+                return []
 
         return lazy(_fetch, list)
 
@@ -0,0 +1,143 @@
+import logging
+import os
+from typing import List
+from urllib.parse import urlsplit
+
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
+
+logger = logging.getLogger(__name__)
+
+FORM_TEMPLATE_NAME = "openformsclient/templatetags/openforms_form.html"
+
+OWN_FORM_TEMPLATE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "templates", FORM_TEMPLATE_NAME
+)
+
+
+def get_preconnect_origins(config) -> List[str]:
+    """
+    Return the origins of the Open Forms API and SDK, which the browser can
+    connect to before they're needed.
+    """
+    origins = []
+    for url in (config.api_root, config.sdk_js_url, config.sdk_css_url):
+        parts = urlsplit(url or "")
+        if not parts.scheme or not parts.netloc:
+            continue
+        origin = f"{parts.scheme}://{parts.netloc}"
+        if origin not in origins:
+            origins.append(origin)
+    return origins
+
+
+def get_sentry_context(config) -> dict:
+    """
+    Return the Sentry DSN and environment to pass to the SDK, if enabled in the
+    configuration.
+    """
+    if not config.use_sentry:
+        return {}
+
+    try:
+        from sentry_sdk import Hub
+
+        opts = Hub.current.client.options
+        return {
+            "sentry_dsn": opts.get("dsn"),
+            "sentry_env": opts.get("environment"),
+        }
+    except ImportError:
+        logger.exception("Sentry integration is enabled but Sentry is not installed.")
+        return {}
+
+
+def uses_own_form_template() -> bool:
+    """
+    Return whether the form template of this package is used, and not a
+    template with the same name of the project.
+    """
+    try:
+        template = get_template(FORM_TEMPLATE_NAME)
+    except TemplateDoesNotExist:
+        return False
+
+    origin = getattr(template, "origin", None)
+    if origin is None or not origin.name:
+        return False
+    return os.path.normcase(os.path.abspath(origin.name)) == os.path.normcase(
+        OWN_FORM_TEMPLATE
+    )
+
+
+def _attribute(name, value):
+    return f'{name}="{conditional_escape(value)}"' if value else ""
+
+
+class FormRenderer:
+    """
+    Render the form template of this package without the template engine.
+
+    The parts that only depend on the configuration are prepared once, so
+    rendering a form only escapes the values that differ per form. The output
+    is the same as the output of the template.
+
+    :param config: The configuration snapshot.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.sentry_context = get_sentry_context(config)
+        self.enabled = uses_own_form_template()
+
+        base_url = conditional_escape(config.api_root)
+        sentry_dsn = _attribute(
+            "data-sentry-dsn", self.sentry_context.get("sentry_dsn")
+        )
+        sentry_env = _attribute(
+            "data-sentry-env", self.sentry_context.get("sentry_env")
+        )
+
+        self._base_url = f'"\n    data-base-url="{base_url}"\n    data-form-id="'
+        self._sentry = f"\n    {sentry_dsn}\n    {sentry_env}\n></div>\n"
+        self._script = (
+            "');\n"
+            "    var form = new OpenForms.OpenForm(targetNode, targetNode.dataset);\n"
+            "    form.init();\n"
+            "</script>\n"
+        )
+
+    def render(
+        self,
+        form_id,
+        html_id,
+        base_path=None,
+        csp_nonce=None,
+        lang=None,
+        defer_init=False,
+    ):
+        html_id = conditional_escape(html_id)
+        parts = [
+            '<div\n    id="',
+            html_id,
+            self._base_url,
+            conditional_escape(form_id),
+            '"\n    ',
+            _attribute("data-base-path", base_path),
+            "\n    ",
+            _attribute("data-csp-nonce", csp_nonce),
+            "\n    ",
+            _attribute("data-lang", lang),
+            self._sentry,
+        ]
+        if not defer_init:
+            parts += [
+                "<script ",
+                _attribute("nonce", csp_nonce),
+                ">\n    var targetNode = document.getElementById('",
+                html_id,
+                self._script,
+            ]
+        return mark_safe("".join(parts))
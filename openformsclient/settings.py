@@ -0,0 +1,48 @@
+from django.conf import settings
+
+DEFAULTS = {
+    # Number of connection pools (one per host) kept by the HTTP session.
+    "POOL_CONNECTIONS": 10,
+    # Maximum number of connections kept alive per host.
+    "POOL_MAXSIZE": 10,
+    # Number of consecutive failed requests after which requests fail fast, or
+    # 0 to disable this.
+    "CIRCUIT_BREAKER_THRESHOLD": 5,
+    # Number of seconds requests fail fast before Open Forms is tried again.
+    "CIRCUIT_BREAKER_TIMEOUT": 30,
+    # Stream and parse the list of forms incrementally, keeping only the
+    # fields that are needed.
+    "STREAM_FORMS": False,
+    # The alias of the Django cache for the forms and health status.
+    "CACHE_ALIAS": "default",
+    # Number of seconds the copy of the configuration of a process is used,
+    # before it's loaded from the database again.
+    "CONFIGURATION_MAX_AGE": 60,
+    # Number of seconds values of the Django cache are also kept in the memory
+    # of the process, or 0 to always use the Django cache.
+    "LOCAL_CACHE_TIMEOUT": 0,
+    # Number of seconds the list of forms is considered fresh.
+    "FORMS_CACHE_TIMEOUT": 60,
+    # Number of seconds an outdated list of forms is still used while they are
+    # refreshed in the background, or when Open Forms is unavailable.
+    "FORMS_CACHE_STALE_TIMEOUT": 60 * 60 * 24,
+    # Number of seconds the health status of the Open Forms API, as shown in
+    # the admin, is considered up to date.
+    "HEALTH_CACHE_TIMEOUT": 30,
+    # Number of seconds an outdated health status is still shown while it's
+    # checked again.
+    "HEALTH_CACHE_STALE_TIMEOUT": 60 * 5,
+    # Retrieve the forms in the background when the application starts.
+    "WARM_CACHE_ON_STARTUP": False,
+    # Use a widget that searches the forms while typing, instead of a select
+    # box with all forms, for Open Forms fields.
+    "AUTOCOMPLETE": False,
+}
+
+
+def get_setting(name):
+    """
+    Return the value of ``OPENFORMSCLIENT_<name>`` from the Django settings, or
+    the default value if it's not set.
+    """
+    return getattr(settings, f"OPENFORMSCLIENT_{name}", DEFAULTS[name])
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .async_client import clear_async_clients
+from .cache import clear_health_status
+from .client import clear_clients
+from .models import Configuration
+
+
+@receiver(post_save, sender=Configuration)
+def invalidate_configuration(sender, **kwargs):
+    clear_clients()
+    clear_async_clients()
+    clear_health_status()
@@ -0,0 +1,127 @@
+import time
+import uuid
+from typing import NamedTuple, Optional
+
+from .async_client import get_async_client
+from .cache import get_shared_cache, is_shared_cache
+from .client import get_client
+from .settings import get_setting
+
+# The version of the configuration, which changes whenever the configuration
+# is saved. It's kept in the shared cache only, so all processes see a change
+# immediately.
+CONFIGURATION_VERSION_KEY = "openformsclient.configuration_version"
+
+# The configuration snapshot of this process, with the version and the
+# (monotonic) time it was taken at.
+_snapshot = None
+
+
+class ConfigurationSnapshot(NamedTuple):
+    """
+    Immutable copy of the :class:`openformsclient.models.Configuration`, to use
+    the configuration without querying the database.
+    """
+
+    api_root: str
+    api_token: str
+    client_timeout: int
+    connect_timeout: Optional[int]
+    read_timeout: Optional[int]
+    request_deadline: Optional[int]
+    max_retries: int
+    retry_backoff: float
+    sdk_css_url: str
+    sdk_js_url: str
+    use_sentry: bool
+
+    @classmethod
+    def from_configuration(cls, config) -> "ConfigurationSnapshot":
+        return cls(**{field: getattr(config, field) for field in cls._fields})
+
+    @property
+    def client(self):
+        return get_client(
+            self.api_root,
+            self.api_token,
+            self.client_timeout,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout,
+            deadline=self.request_deadline,
+            max_retries=self.max_retries,
+            retry_backoff=self.retry_backoff,
+            pool_connections=get_setting("POOL_CONNECTIONS"),
+            pool_maxsize=get_setting("POOL_MAXSIZE"),
+            failure_threshold=get_setting("CIRCUIT_BREAKER_THRESHOLD"),
+            recovery_timeout=get_setting("CIRCUIT_BREAKER_TIMEOUT"),
+        )
+
+    @property
+    def async_client(self):
+        """
+        The async client, which can only be used in a running event loop.
+        """
+        return get_async_client(
+            self.api_root,
+            self.api_token,
+            self.client_timeout,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout,
+            max_retries=self.max_retries,
+            pool_maxsize=get_setting("POOL_MAXSIZE"),
+        )
+
+
+def get_configuration_version() -> str:
+    """
+    Return the current version of the configuration from the shared cache.
+    """
+    cache = get_shared_cache()
+    version = cache.get(CONFIGURATION_VERSION_KEY)
+    if version is None:
+        # The first process to find no version sets it.
+        cache.add(CONFIGURATION_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(CONFIGURATION_VERSION_KEY)
+    return version
+
+
+def bump_configuration_version():
+    """
+    Change the version of the configuration, so all processes load the
+    configuration again.
+    """
+    get_shared_cache().set(CONFIGURATION_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def get_configuration_snapshot() -> ConfigurationSnapshot:
+    """
+    Return a snapshot of the configuration.
+
+    The configuration is only loaded from the database when it was saved since
+    the last snapshot was taken, so usually this is a single lookup in the
+    shared cache. A snapshot older than ``OPENFORMSCLIENT_CONFIGURATION_MAX_AGE``
+    seconds is taken again, in case a change of the version was missed.
+
+    Without a cache that is shared by all processes, the version can't signal
+    changes made by other processes, so the configuration is loaded every time.
+    """
+    global _snapshot
+
+    version = get_configuration_version()
+
+    snapshot = _snapshot
+    if (
+        snapshot is None
+        or version is None
+        or snapshot[0] != version
+        or time.monotonic() - snapshot[1] >= get_setting("CONFIGURATION_MAX_AGE")
+        or not is_shared_cache()
+    ):
+        from .models import Configuration
+
+        snapshot = _snapshot = (
+            version,
+            time.monotonic(),
+            ConfigurationSnapshot.from_configuration(Configuration.get_solo()),
+        )
+    return snapshot[2]
@@ -0,0 +1,17 @@
+'use strict';
+{
+    const $ = django.jQuery;
+
+    const init = function($elements) {
+        // The URL and other options are set as data attributes on the element.
+        $elements.not('[name*=__prefix__]').select2();
+    };
+
+    $(function() {
+        init($('.openforms-autocomplete'));
+    });
+
+    document.addEventListener('formset:added', (event) => {
+        init($(event.target).find('.openforms-autocomplete'));
+    });
+}
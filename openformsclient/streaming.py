@@ -0,0 +1,79 @@
+import json
+from typing import Iterable, Iterator, Optional
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+# JSON events of values that can be projected.
+SCALAR_EVENTS = frozenset({"string", "number", "boolean", "null"})
+
+
+def iter_projected_items(
+    fileobj, fields: Iterable[str], metadata: Optional[dict] = None
+) -> Iterator[dict]:
+    """
+    Parse a list of objects from a JSON document, and yield each object with
+    only the given fields.
+
+    The document is either a list of objects or an object with the list under
+    ``"results"``. If `ijson`_ is installed, the document is parsed
+    incrementally so only the projected fields are kept in memory. Otherwise,
+    the whole document is parsed first.
+
+    Only fields with a scalar value (string, number, boolean or null) are
+    included.
+
+    :param fileobj: A file-like object with the JSON document as bytes.
+    :param fields: The fields to keep of each object.
+    :param metadata: Optional dict that is filled with the scalar fields of the
+        document, if it's an object, like pagination links. The fields are
+        added as soon as they are parsed.
+
+    .. _`ijson`: https://pypi.org/project/ijson/
+    """
+    fields = frozenset(fields)
+    if metadata is None:
+        metadata = {}
+
+    if ijson is None:
+        data = json.load(fileobj)
+        if isinstance(data, dict):
+            metadata.update(
+                (key, value)
+                for key, value in data.items()
+                if not isinstance(value, (dict, list))
+            )
+            items = data["results"]
+        else:
+            items = data
+        for item in items:
+            yield {
+                key: value
+                for key, value in item.items()
+                if key in fields and not isinstance(value, (dict, list))
+            }
+        return
+
+    prefix = None
+    item = None
+    for path, event, value in ijson.parse(fileobj, use_float=True):
+        if prefix is None:
+            # The first event determines the shape of the document.
+            prefix = "item" if event == "start_array" else "results.item"
+            continue
+
+        if path == prefix:
+            if event == "start_map":
+                item = {}
+            elif event == "end_map":
+                yield item
+                item = None
+        elif event in SCALAR_EVENTS:
+            if item is not None:
+                key = path[len(prefix) + 1 :]
+                if key in fields:
+                    item[key] = value
+            elif path and "." not in path:
+                metadata[path] = value
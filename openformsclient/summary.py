@@ -0,0 +1,33 @@
+from typing import NamedTuple
+
+
+class FormSummary(NamedTuple):
+    """
+    The fields of a form in Open Forms that are needed to choose and look up
+    forms.
+
+    Being a named tuple, a summary is a lot smaller in memory and when pickled
+    (for example in a cache) than the form in the API response.
+    """
+
+    uuid: str
+    slug: str
+    name: str
+    active: bool = True
+    maintenance_mode: bool = False
+
+    # The fields in the API response.
+    API_FIELDS = ("uuid", "slug", "name", "active", "maintenanceMode")
+
+    @classmethod
+    def from_api(cls, data: dict) -> "FormSummary":
+        """
+        Create a summary from a form in an Open Forms API response.
+        """
+        return cls(
+            uuid=str(data["uuid"]),
+            slug=data["slug"],
+            name=data["name"],
+            active=data.get("active", True),
+            maintenance_mode=data.get("maintenanceMode", False),
+        )
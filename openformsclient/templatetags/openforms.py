@@ -1,82 +1,251 @@
-import logging
+import json
 
 from django import template
 from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
 
-from ..models import Configuration
+from asgiref.sync import sync_to_async
 
-logger = logging.getLogger(__name__)
+from ..lru import LRUCache
+from ..rendering import FORM_TEMPLATE_NAME, FormRenderer, get_preconnect_origins
+from ..snapshot import get_configuration_snapshot
 
 register = template.Library()
 
-
-@register.simple_tag
-def openforms_form(form_id, csp_nonce=None, base_path=None, lang=None, html_id=None):
-    template_name = "openformsclient/templatetags/openforms_form.html"
-
-    config = Configuration.get_solo()
-
-    context = {
-        "html_id": html_id or "openforms-root",
+CONFIGURATION_ATTR = "_openformsclient_configuration"
+
+# The HTML IDs of the forms that are initialized by the bootstrap tag.
+DEFERRED_FORMS_ATTR = "_openformsclient_deferred_forms"
+
+# The ways the SDK script can be loaded without blocking the page.
+SCRIPT_LOADING = ("defer", "async")
+
+# Characters that are escaped to embed JSON in a script.
+JSON_SCRIPT_ESCAPES = {
+    ord(">"): "\\u003E",
+    ord("<"): "\\u003C",
+    ord("&"): "\\u0026",
+}
+
+# The rendered SDK tags per configuration snapshot. A new snapshot is taken
+# whenever the configuration is saved.
+_rendered_tags = LRUCache(maxsize=32)
+
+# The renderer of the form tag for the current configuration snapshot.
+_form_renderer = None
+
+
+def get_configuration(context):
+    """
+    Return the configuration snapshot, retrieved at most once per request.
+
+    The snapshot is stored on the request if it's available in the template
+    context, or on the template context itself otherwise. This way, multiple
+    template tags on a page use the same configuration.
+    """
+    holder = context.get("request") or context
+
+    config = getattr(holder, CONFIGURATION_ATTR, None)
+    if config is None:
+        config = get_configuration_snapshot()
+        setattr(holder, CONFIGURATION_ATTR, config)
+    return config
+
+
+async def aget_configuration(request):
+    """
+    Async variant of :func:`get_configuration`.
+
+    Async views can use this to load the configuration up front, so the template
+    tags don't need to query the database while rendering.
+    """
+    config = getattr(request, CONFIGURATION_ATTR, None)
+    if config is None:
+        config = await sync_to_async(get_configuration_snapshot)()
+        setattr(request, CONFIGURATION_ATTR, config)
+    return config
+
+
+def render_cached(template_name, config, tag_context):
+    """
+    Render the template, which only depends on the configuration, once per
+    configuration snapshot.
+    """
+    key = (template_name, config, tuple(sorted(tag_context.items())))
+    html = _rendered_tags.get(key)
+    if html is None:
+        html = render_to_string(template_name, tag_context)
+        _rendered_tags.set(key, html)
+    return html
+
+
+def get_form_renderer(config) -> FormRenderer:
+    """
+    Return the renderer of the form tag for the configuration snapshot, which
+    is replaced whenever the configuration is saved.
+    """
+    global _form_renderer
+
+    renderer = _form_renderer
+    if renderer is None or renderer.config is not config:
+        renderer = _form_renderer = FormRenderer(config)
+    return renderer
+
+
+def register_deferred_form(context, html_id=None) -> str:
+    """
+    Register a form to be initialized by the bootstrap tag, and return its
+    HTML ID, which is made unique if it's not given.
+
+    Like the configuration, the forms are registered on the request if it's
+    available in the template context, or on the template context otherwise.
+    """
+    holder = context.get("request") or context
+
+    html_ids = getattr(holder, DEFERRED_FORMS_ATTR, None)
+    if html_ids is None:
+        html_ids = []
+        setattr(holder, DEFERRED_FORMS_ATTR, html_ids)
+
+    if not html_id:
+        html_id = "openforms-root"
+        count = 1
+        while html_id in html_ids:
+            count += 1
+            html_id = f"openforms-root-{count}"
+
+    html_ids.append(html_id)
+    return html_id
+
+
+@register.simple_tag(takes_context=True)
+def openforms_form(
+    context,
+    form_id,
+    csp_nonce=None,
+    base_path=None,
+    lang=None,
+    html_id=None,
+    defer_init=False,
+):
+    config = get_configuration(context)
+    if defer_init:
+        html_id = register_deferred_form(context, html_id)
+    else:
+        html_id = html_id or "openforms-root"
+
+    renderer = get_form_renderer(config)
+    if renderer.enabled:
+        return renderer.render(
+            form_id,
+            html_id,
+            base_path=base_path,
+            csp_nonce=csp_nonce,
+            lang=lang,
+            defer_init=defer_init,
+        )
+
+    # The template is overridden by the project.
+    tag_context = {
+        "html_id": html_id,
         "base_url": config.api_root,
         "form_id": form_id,
         "base_path": base_path,
         "csp_nonce": csp_nonce,
         "lang": lang,
+        "defer_init": defer_init,
+        **renderer.sentry_context,
     }
 
-    if config.use_sentry:
-        try:
-            from sentry_sdk import Hub
+    return render_to_string(FORM_TEMPLATE_NAME, tag_context)
 
-            opts = Hub.current.client.options
 
-            context["sentry_dsn"] = opts.get("dsn")
-            context["sentry_env"] = opts.get("environment")
+@register.simple_tag(takes_context=True)
+def openforms_bootstrap(context, csp_nonce=None):
+    """
+    Initialize all forms on the page that were rendered with ``defer_init``,
+    with a single script.
+    """
+    template_name = "openformsclient/templatetags/openforms_bootstrap.html"
+
+    holder = context.get("request") or context
+    html_ids = getattr(holder, DEFERRED_FORMS_ATTR, None)
+    if not html_ids:
+        return ""
+    # Forms are only initialized once, even if the tag is used again.
+    setattr(holder, DEFERRED_FORMS_ATTR, [])
+
+    tag_context = {
+        "html_ids": mark_safe(json.dumps(html_ids).translate(JSON_SCRIPT_ESCAPES)),
+        "csp_nonce": csp_nonce,
+    }
+
+    return render_to_string(template_name, tag_context)
+
+
+def get_sdk_context(config, hints=False) -> dict:
+    """
+    Return the origins to connect to early, if resource hints are enabled.
+    """
+    return {
+        "origins": tuple(get_preconnect_origins(config)) if hints else (),
+    }
 
-        except ImportError:
-            logger.exception(
-                "Sentry integration is enabled but Sentry is not installed."
-            )
 
-    return render_to_string(template_name, context)
+def check_load(load):
+    """
+    Return how the SDK script is loaded: ``"defer"``, ``"async"`` or ``None``
+    to block the page while loading.
+    """
+    if load and load not in SCRIPT_LOADING:
+        raise template.TemplateSyntaxError(
+            f"The SDK can be loaded with {' or '.join(SCRIPT_LOADING)}, not {load!r}."
+        )
+    return load or None
 
 
-@register.simple_tag
-def openforms_sdk_media():
+@register.simple_tag(takes_context=True)
+def openforms_sdk_media(context, hints=False, preload=False, load=None):
     template_name = "openformsclient/templatetags/openforms_sdk_media.html"
 
-    config = Configuration.get_solo()
+    config = get_configuration(context)
 
-    context = {
+    tag_context = {
         "sdk_js_url": config.sdk_js_url,
         "sdk_css_url": config.sdk_css_url,
+        "preload": preload,
+        "load": check_load(load),
+        **get_sdk_context(config, hints),
     }
 
-    return render_to_string(template_name, context)
+    return render_cached(template_name, config, tag_context)
 
 
-@register.simple_tag
-def openforms_sdk_js():
+@register.simple_tag(takes_context=True)
+def openforms_sdk_js(context, hints=False, load=None):
     template_name = "openformsclient/templatetags/openforms_sdk_js.html"
 
-    config = Configuration.get_solo()
+    config = get_configuration(context)
 
-    context = {
+    tag_context = {
         "sdk_js_url": config.sdk_js_url,
+        "load": check_load(load),
+        **get_sdk_context(config, hints),
     }
 
-    return render_to_string(template_name, context)
+    return render_cached(template_name, config, tag_context)
 
 
-@register.simple_tag
-def openforms_sdk_css():
+@register.simple_tag(takes_context=True)
+def openforms_sdk_css(context, hints=False, preload=False):
     template_name = "openformsclient/templatetags/openforms_sdk_css.html"
 
-    config = Configuration.get_solo()
+    config = get_configuration(context)
 
-    context = {
+    tag_context = {
         "sdk_css_url": config.sdk_css_url,
+        "preload": preload,
+        **get_sdk_context(config, hints),
     }
 
-    return render_to_string(template_name, context)
+    return render_cached(template_name, config, tag_context)
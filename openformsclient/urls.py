@@ -0,0 +1,11 @@
+from django.urls import path
+
+from .views import FormAutocompleteView
+
+app_name = "openformsclient"
+
+urlpatterns = [
+    path(
+        "forms/autocomplete", FormAutocompleteView.as_view(), name="form-autocomplete"
+    ),
+]
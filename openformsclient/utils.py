@@ -1,22 +1,91 @@
 import logging
 
+from asgiref.sync import sync_to_async
+
+from .index import FormIndex
+from .rendering import get_preconnect_origins
+from .snapshot import get_configuration_snapshot
+from .summary import FormSummary
+
 logger = logging.getLogger(__name__)
 
 
 def get_form_choices(client=None, use_uuids=False):
     if client is None:
-        from .models import Configuration
-
-        config = Configuration.get_solo()
-        client = config.client
+        client = get_configuration_snapshot().client
 
     if not client.has_config():
         return []
 
     response = client.get_forms()
 
-    key = "uuid" if use_uuids else "slug"
-    return sorted(
-        [(item[key], item["name"]) for item in response],
-        key=lambda entry: entry[1],
-    )
+    return build_form_choices(response, use_uuids)
+
+
+async def aget_form_choices(client=None, use_uuids=False):
+    """
+    Async variant of :func:`get_form_choices`, using the async client.
+    """
+    if client is None:
+        config = await sync_to_async(get_configuration_snapshot)()
+        client = config.async_client
+
+    if not client.has_config():
+        return []
+
+    response = await client.get_forms()
+
+    return build_form_choices(response, use_uuids)
+
+
+def build_form_choices(forms, use_uuids=False):
+    """
+    Return the form choices, sorted by name ignoring accents and case, from the
+    forms in an Open Forms API response.
+
+    :param forms: The forms, as returned by ``Client.get_forms``.
+    :param use_uuids: Use the form UUID as choice value instead of the slug.
+    """
+    index = FormIndex(FormSummary.from_api(form) for form in forms)
+    return index.get_choices(use_uuids)
+
+
+def get_link_header(config=None, preconnect=True, preload=True) -> str:
+    """
+    Return the value of a ``Link`` response header with resource hints for the
+    Open Forms API and SDK.
+
+    Browsers act on the header before they receive the page, and some proxies
+    and CDNs send it early as a ``103 Early Hints`` response.
+
+    :param config: The configuration, or ``None`` to use the current one.
+    :param preconnect: Connect to the Open Forms API and SDK hosts early.
+    :param preload: Load the SDK stylesheet and script early.
+    """
+    if config is None:
+        config = get_configuration_snapshot()
+
+    links = []
+    if preconnect:
+        links += [
+            f"<{origin}>; rel=preconnect" for origin in get_preconnect_origins(config)
+        ]
+    if preload:
+        if config.sdk_css_url:
+            links.append(f"<{config.sdk_css_url}>; rel=preload; as=style")
+        if config.sdk_js_url:
+            links.append(f"<{config.sdk_js_url}>; rel=preload; as=script")
+
+    return ", ".join(links)
+
+
+def add_link_header(response, config=None, preconnect=True, preload=True):
+    """
+    Add the resource hints of :func:`get_link_header` to the ``Link`` header of
+    the response, and return the response.
+    """
+    link = get_link_header(config, preconnect=preconnect, preload=preload)
+    if link:
+        existing = response.headers.get("Link")
+        response.headers["Link"] = f"{existing}, {link}" if existing else link
+    return response
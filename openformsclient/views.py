@@ -0,0 +1,58 @@
+import logging
+
+from django.contrib.auth.mixins import UserPassesTestMixin
+from django.http import JsonResponse
+from django.views import View
+
+from .cache import get_form_index
+
+logger = logging.getLogger(__name__)
+
+
+class FormAutocompleteView(UserPassesTestMixin, View):
+    """
+    Search the cached forms by name or slug, in the format that `Select2`_
+    expects.
+
+    Query parameters:
+
+    * ``term``: The text to search for.
+    * ``page``: The page of results, starting at 1.
+    * ``use_uuids``: Use the form UUID as result ID instead of the slug.
+
+    Only staff users are allowed to search the forms.
+
+    .. _`Select2`: https://select2.org/
+    """
+
+    paginate_by = 20
+
+    def test_func(self):
+        return self.request.user.is_active and self.request.user.is_staff
+
+    def get(self, request, *args, **kwargs):
+        term = request.GET.get("term", "")
+        use_uuids = request.GET.get("use_uuids") in ("1", "true")
+        try:
+            page = max(int(request.GET.get("page", 1)), 1)
+        except ValueError:
+            page = 1
+
+        # One extra form is retrieved to know if there are more pages.
+        limit = page * self.paginate_by
+        try:
+            forms = get_form_index().search(term, limit=limit + 1)
+        except Exception as exc:
+            logger.exception(exc)
+            forms = []
+        key = "uuid" if use_uuids else "slug"
+
+        return JsonResponse(
+            {
+                "results": [
+                    {"id": getattr(form, key), "text": form.name}
+                    for form in forms[limit - self.paginate_by : limit]
+                ],
+                "pagination": {"more": len(forms) > limit},
+            }
+        )
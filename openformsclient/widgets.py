@@ -0,0 +1,148 @@
+import logging
+
+from django.forms.widgets import Select, Widget
+from django.urls import reverse
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from .cache import get_form_index
+from .lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class OpenFormsSelect(Select):
+    """
+    Select widget that renders the options of the same list of choices once,
+    instead of for every field, like the rows of an admin inline.
+    """
+
+    template_name = "openformsclient/widgets/select.html"
+
+    # The rendered options per list of choices. The choices of Open Forms
+    # fields only change when the forms are retrieved again.
+    _rendered_options = LRUCache(maxsize=16)
+
+    def get_context(self, name, value, attrs):
+        choices = tuple(self.choices)
+        if not all(type(label) is str for _value, label in choices):
+            # Option groups and translated labels are rendered as usual.
+            return super().get_context(name, value, attrs)
+
+        # The options are not part of the context, so skip their creation by
+        # the choice widget.
+        context = Widget.get_context(self, name, value, attrs)
+        context["widget"]["options_html"] = self.render_options(
+            choices, context["widget"]["value"]
+        )
+        return context
+
+    def render_options(self, choices, value):
+        rendered = self._rendered_options.get(choices)
+        if rendered is None:
+            rendered = self._render_options(choices)
+            self._rendered_options.set(choices, rendered)
+        options, positions = rendered
+
+        position = next((positions[v] for v in value if v in positions), None)
+        if position is None:
+            return mark_safe("".join(options))
+
+        option_value, label = choices[position]
+        selected = format_html(
+            '\n  <option value="{}" selected>{}</option>\n',
+            "" if option_value is None else option_value,
+            label,
+        )
+        return mark_safe(
+            "".join(options[:position]) + selected + "".join(options[position + 1 :])
+        )
+
+    def _render_options(self, choices):
+        options = []
+        positions = {}
+        for position, (option_value, label) in enumerate(choices):
+            if option_value is None:
+                option_value = ""
+            positions.setdefault(str(option_value), position)
+            options.append(
+                format_html('\n  <option value="{}">{}</option>\n', option_value, label)
+            )
+        return options, positions
+
+
+class OpenFormsAutocompleteWidget(Select):
+    """
+    Select widget that only renders the selected form, and searches the other
+    forms while typing, via :class:`openformsclient.views.FormAutocompleteView`.
+
+    It uses the `Select2`_ library that comes with the Django admin, and
+    requires the URLs of ``openformsclient.urls`` to be included.
+
+    .. _`Select2`: https://select2.org/
+    """
+
+    url_name = "openformsclient:form-autocomplete"
+
+    def __init__(self, attrs=None, choices=(), use_uuids=False):
+        super().__init__(attrs, choices)
+        self.use_uuids = use_uuids
+
+    class Media:
+        css = {
+            "screen": (
+                "admin/css/vendor/select2/select2.css",
+                "admin/css/autocomplete.css",
+            ),
+        }
+        js = (
+            "admin/js/vendor/jquery/jquery.js",
+            "admin/js/vendor/select2/select2.full.js",
+            "admin/js/jquery.init.js",
+            "openformsclient/js/autocomplete.js",
+        )
+
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        attrs = super().build_attrs(base_attrs, extra_attrs)
+        url = reverse(self.url_name)
+        if self.use_uuids:
+            url = f"{url}?use_uuids=1"
+
+        attrs.setdefault("class", "")
+        attrs.update(
+            {
+                "class": f"{attrs['class']} openforms-autocomplete".strip(),
+                "data-ajax--url": url,
+                "data-ajax--cache": "true",
+                "data-ajax--delay": 250,
+                "data-ajax--type": "GET",
+                "data-allow-clear": "false" if self.is_required else "true",
+                "data-placeholder": "",
+                "data-theme": "admin-autocomplete",
+                "lang": "",
+            }
+        )
+        return attrs
+
+    def optgroups(self, name, value, attrs=None):
+        # Only the selected forms are rendered, the other forms are retrieved
+        # while searching. The full list of choices is still used to validate
+        # the submitted value.
+        selected = {str(v) for v in value if v not in ("", None)}
+        options = []
+        if not self.is_required:
+            options.append(self.create_option(name, "", "", not selected, 0))
+
+        try:
+            form_index = get_form_index()
+        except Exception as exc:
+            logger.exception(exc)
+            form_index = None
+
+        for index, option_value in enumerate(sorted(selected), start=len(options)):
+            label = (form_index and form_index.name_for(option_value)) or option_value
+            options.append(
+                self.create_option(name, option_value, label, True, index, attrs=attrs)
+            )
+
+        return [(None, options, 0)] if options else []
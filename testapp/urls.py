@@ -2,12 +2,13 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.contrib.staticfiles.urls import staticfiles_urlpatterns
-from django.urls import path
+from django.urls import include, path
 
 from .views import IndexView, PageView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("openforms/", include("openformsclient.urls")),
     # The view thats starts the form
     path("page/<slug:slug>", PageView.as_view(), name="page"),
     # Whenever you refresh the page that has the form, the URL might be changed
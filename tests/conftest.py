@@ -1,7 +1,9 @@
+from django.core.cache import cache
+
 import pytest
 from decouple import config
 
-from openformsclient.client import Client
+from openformsclient.client import Client, clear_clients
 
 API_ROOT = config("OFC_API_ROOT", "https://open-forms.test.maykin.opengem.nl/api/v2/")
 API_TOKEN = config("OFC_API_TOKEN", "hush-hush")
@@ -15,3 +17,10 @@ def client():
 @pytest.fixture
 def bogus_client():
     return Client(api_root=API_ROOT, api_token="bogus", client_timeout=2)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(monkeypatch):
+    cache.clear()
+    clear_clients()
+    monkeypatch.setattr("openformsclient.cache._two_level_cache", None)
@@ -0,0 +1,119 @@
+from unittest.mock import patch
+
+from django.contrib import admin
+from django.test import TestCase, override_settings
+
+import requests_mock
+import time_machine
+
+from openformsclient.admin import ConfigurationAdmin
+from openformsclient.cache import get_health_status
+from openformsclient.models import Configuration
+
+
+@requests_mock.Mocker()
+class ConfigurationAdminStatusTests(TestCase):
+    def setUp(self):
+        self.config = Configuration.objects.create(
+            api_root="https://example.com/api/v1/",
+            api_token="token",
+        )
+        self.model_admin = ConfigurationAdmin(Configuration, admin.site)
+
+    @patch("openformsclient.cache.run_in_background")
+    def test_status_unknown(self, m, mock_run):
+        result = self.model_admin.status(self.config)
+
+        self.assertIn("icon-unknown", result)
+        self.assertIn("The status is being checked.", result)
+        mock_run.assert_called_once()
+        self.assertEqual(m.call_count, 0)
+
+    @patch("openformsclient.cache.run_in_background", lambda func: func())
+    def test_status_healthy(self, m):
+        m.head(f"{self.config.api_root}public/forms")
+
+        with time_machine.travel(0, tick=False) as traveller:
+            self.model_admin.status(self.config)
+            traveller.shift(5)
+
+            result = self.model_admin.status(self.config)
+
+        self.assertIn("icon-yes", result)
+        self.assertIn("Checked 5 seconds ago", result)
+        self.assertEqual(m.call_count, 1)
+
+    @patch("openformsclient.cache.run_in_background", lambda func: func())
+    def test_status_unhealthy(self, m):
+        m.head(f"{self.config.api_root}public/forms", status_code=401)
+        m.get(
+            f"{self.config.api_root}public/forms",
+            status_code=401,
+            json={"detail": "Invalid token."},
+        )
+
+        self.model_admin.status(self.config)
+        result = self.model_admin.status(self.config)
+
+        self.assertIn("icon-no", result)
+        self.assertIn("Invalid token.", result)
+
+    @patch("openformsclient.cache.run_in_background", lambda func: func())
+    def test_status_circuit_breaker_open(self, m):
+        m.head(f"{self.config.api_root}public/forms", status_code=503)
+        m.get(f"{self.config.api_root}public/forms", status_code=503)
+
+        for _ in range(5):
+            self.config.client.circuit_breaker.record_failure()
+
+        self.model_admin.status(self.config)
+        result = self.model_admin.status(self.config)
+
+        self.assertIn("icon-no", result)
+        self.assertIn("The Open Forms API is unavailable", result)
+        self.assertIn("(circuit open)", result)
+        self.assertEqual(m.call_count, 0)
+
+    def test_status_is_refreshed_after_timeout(self, m):
+        m.head(f"{self.config.api_root}public/forms")
+
+        with time_machine.travel(0, tick=False) as traveller:
+            with patch("openformsclient.cache.run_in_background", lambda func: func()):
+                get_health_status()
+
+            traveller.shift(30)
+
+            with patch("openformsclient.cache.run_in_background") as mock_run:
+                status = get_health_status()
+                get_health_status()
+
+        self.assertTrue(status.healthy)
+        mock_run.assert_called_once()
+
+    @override_settings(
+        OPENFORMSCLIENT_HEALTH_CACHE_TIMEOUT=30,
+        OPENFORMSCLIENT_HEALTH_CACHE_STALE_TIMEOUT=60,
+    )
+    def test_outdated_status_expires(self, m):
+        m.head(f"{self.config.api_root}public/forms")
+
+        with time_machine.travel(0, tick=False) as traveller:
+            with patch("openformsclient.cache.run_in_background", lambda func: func()):
+                get_health_status()
+
+            with patch("openformsclient.cache.run_in_background"):
+                traveller.shift(89)
+                self.assertIsNotNone(get_health_status())
+
+                traveller.shift(1)
+                self.assertIsNone(get_health_status())
+
+    @patch("openformsclient.cache.run_in_background", lambda func: func())
+    def test_status_is_cleared_on_save(self, m):
+        m.head(f"{self.config.api_root}public/forms")
+
+        get_health_status()
+        self.config.save()
+
+        with patch("openformsclient.cache.run_in_background"):
+            self.assertIsNone(get_health_status())
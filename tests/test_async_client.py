@@ -0,0 +1,182 @@
+import asyncio
+
+import httpx
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from requests.exceptions import InvalidURL
+
+from openformsclient.async_client import (
+    AsyncClient,
+    clear_async_clients,
+    get_async_client,
+)
+
+API_ROOT = "https://example.com/api/v1/"
+
+
+def _client(handler):
+    return AsyncClient(
+        API_ROOT, "token", client_timeout=2, transport=httpx.MockTransport(handler)
+    )
+
+
+def _forms_handler(request):
+    assert request.headers["Authorization"] == "Token token"
+
+    if request.url.path == "/api/v1/public/forms":
+        return httpx.Response(200, json=[{"uuid": "1", "slug": "test", "name": "T"}])
+    if request.url.path == "/api/v1/forms/test":
+        return httpx.Response(200, json={"uuid": "1", "slug": "test", "name": "T"})
+    return httpx.Response(404, json={"detail": "Not found."})
+
+
+def test_async_client_has_config():
+    assert AsyncClient(API_ROOT, "token", 2).has_config()
+    assert not AsyncClient("", "", "").has_config()
+
+
+def test_async_client_is_healthy():
+    client = _client(_forms_handler)
+
+    health, msg = async_to_sync(client.is_healthy)()
+
+    assert health
+    assert msg == ""
+
+
+def test_async_client_is_not_healthy():
+    client = _client(lambda request: httpx.Response(401, json={"detail": "Nope."}))
+
+    health, msg = async_to_sync(client.is_healthy)()
+
+    assert not health
+    assert msg == "Nope."
+
+
+def test_async_client_get_forms():
+    client = _client(_forms_handler)
+
+    result = async_to_sync(client.get_forms)()
+
+    assert result == [{"uuid": "1", "slug": "test", "name": "T"}]
+
+
+def test_async_client_get_form():
+    client = _client(_forms_handler)
+
+    result = async_to_sync(client.get_form)("test")
+
+    assert result["uuid"] == "1"
+
+
+def test_async_client_get_form_not_found():
+    client = _client(_forms_handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        async_to_sync(client.get_form)("bogus")
+
+
+def test_async_client_reuses_session():
+    client = _client(_forms_handler)
+
+    async def _run():
+        session = client.session
+        await client.get_forms()
+        await client.get_forms()
+        assert client.session is session
+        await client.aclose()
+        assert client.session is not session
+
+    async_to_sync(_run)()
+
+
+def test_async_client_get_forms_paginated():
+    def handler(request):
+        if request.url.params.get("page") == "2":
+            return httpx.Response(200, json={"next": None, "results": [{"uuid": "2"}]})
+        return httpx.Response(
+            200,
+            json={
+                "next": f"{API_ROOT}public/forms?page=2",
+                "results": [{"uuid": "1"}],
+            },
+        )
+
+    client = _client(handler)
+
+    result = async_to_sync(client.get_forms)()
+
+    assert result == [{"uuid": "1"}, {"uuid": "2"}]
+
+
+def test_async_client_get_forms_paginated_other_host():
+    def handler(request):
+        assert request.url.host == "example.com"
+        return httpx.Response(
+            200,
+            json={
+                "next": "https://evil.example.org/public/forms?page=2",
+                "results": [{"uuid": "1"}],
+            },
+        )
+
+    client = _client(handler)
+
+    with pytest.raises(InvalidURL):
+        async_to_sync(client.get_forms)()
+
+
+async def _wait_for_closing():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def test_async_client_context_manager():
+    async def _run():
+        async with _client(_forms_handler) as client:
+            await client.get_forms()
+            session = client.session
+
+        assert session.is_closed
+
+    async_to_sync(_run)()
+
+
+def test_replaced_async_client_is_closed():
+    transport = httpx.MockTransport(_forms_handler)
+
+    async def _run():
+        client = get_async_client(API_ROOT, "token", 2, transport=transport)
+        await client.get_forms()
+        session = client.session
+
+        other_client = get_async_client(API_ROOT, "other", 2, transport=transport)
+        await _wait_for_closing()
+
+        assert other_client is not client
+        assert session.is_closed
+
+    async_to_sync(_run)()
+
+
+def test_cleared_async_clients_are_closed():
+    transport = httpx.MockTransport(_forms_handler)
+
+    async def _run(clear):
+        client = get_async_client(API_ROOT, "token", 2, transport=transport)
+        await client.get_forms()
+        session = client.session
+
+        await clear()
+        await _wait_for_closing()
+
+        assert session.is_closed
+        assert get_async_client(API_ROOT, "token", 2, transport=transport) is not client
+
+    async def clear_in_loop():
+        clear_async_clients()
+
+    # The configuration can be saved in the thread of the event loop, or in
+    # another thread.
+    async_to_sync(_run)(clear_in_loop)
+    async_to_sync(_run)(sync_to_async(clear_async_clients))
@@ -0,0 +1,167 @@
+from unittest.mock import patch
+
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+
+from openformsclient.cache import (
+    CachedForms,
+    TwoLevelCache,
+    _revalidate,
+    get_cache,
+    get_cached_forms,
+    get_forms_cache_key,
+)
+from openformsclient.models import Configuration
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "openforms": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "openforms",
+    },
+}
+
+
+@patch(
+    "openformsclient.cache._fetch_forms",
+    lambda previous=None: CachedForms(["form"], None),
+)
+@override_settings(CACHES=CACHES)
+class CacheAliasTests(TestCase):
+    def tearDown(self):
+        caches["openforms"].clear()
+
+    def test_default_cache(self):
+        self.assertIs(get_cache(), caches["default"])
+
+    @override_settings(OPENFORMSCLIENT_CACHE_ALIAS="openforms")
+    def test_cache_alias(self):
+        self.assertIs(get_cache(), caches["openforms"])
+
+        get_cached_forms()
+
+        self.assertIsNone(cache.get(get_forms_cache_key()))
+        self.assertIsNotNone(caches["openforms"].get(get_forms_cache_key()))
+
+
+class FormsCacheKeyTests(TestCase):
+    def test_forms_are_scoped_to_the_configuration(self):
+        with patch(
+            "openformsclient.cache._fetch_forms",
+            lambda previous=None: CachedForms(["old"], None),
+        ):
+            get_cached_forms()
+        key = get_forms_cache_key()
+
+        Configuration.get_solo().save()
+
+        self.assertNotEqual(get_forms_cache_key(), key)
+        with patch(
+            "openformsclient.cache._fetch_forms",
+            lambda previous=None: CachedForms(["new"], None),
+        ):
+            self.assertEqual(get_cached_forms(), ["new"])
+
+    def test_outdated_refresh_is_not_used(self):
+        key = get_forms_cache_key()
+        Configuration.get_solo().save()
+
+        # A refresh that started before the configuration was saved finishes
+        # after it.
+        _revalidate(
+            key,
+            lambda previous: CachedForms(["old"], None),
+            timeout=60,
+            stale_timeout=60,
+            previous=None,
+        )
+
+        with patch(
+            "openformsclient.cache._fetch_forms",
+            lambda previous=None: CachedForms(["new"], None),
+        ):
+            self.assertEqual(get_cached_forms(), ["new"])
+
+
+@override_settings(CACHES=CACHES)
+class TwoLevelCacheTests(TestCase):
+    def setUp(self):
+        self.cache = TwoLevelCache("openforms", local_timeout=10)
+
+    def tearDown(self):
+        caches["openforms"].clear()
+
+    def test_get_and_set(self):
+        self.cache.set("key", "value", timeout=60)
+
+        self.assertEqual(self.cache.get("key"), "value")
+        self.assertEqual(caches["openforms"].get("key"), "value")
+        self.assertIsNone(self.cache.get("unknown"))
+        self.assertEqual(
+            self.cache.stats, {"local_hits": 1, "shared_hits": 0, "misses": 1}
+        )
+
+    def test_local_level_is_filled_from_shared_cache(self):
+        caches["openforms"].set("key", "value")
+
+        self.assertEqual(self.cache.get("key"), "value")
+        caches["openforms"].delete("key")
+        self.assertEqual(self.cache.get("key"), "value")
+
+        self.assertEqual(
+            self.cache.stats, {"local_hits": 1, "shared_hits": 1, "misses": 0}
+        )
+
+    @patch("openformsclient.lru.time.monotonic")
+    def test_local_timeout(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        caches["openforms"].set("key", "value")
+        self.cache.get("key")
+        caches["openforms"].set("key", "new value")
+
+        mock_monotonic.return_value = 9
+        self.assertEqual(self.cache.get("key"), "value")
+
+        mock_monotonic.return_value = 10
+        self.assertEqual(self.cache.get("key"), "new value")
+
+    @patch("openformsclient.lru.time.monotonic")
+    def test_local_timeout_is_limited_by_timeout(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        self.cache.set("key", "value", timeout=5)
+        caches["openforms"].delete("key")
+
+        mock_monotonic.return_value = 5
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_delete(self):
+        self.cache.set("key", "value")
+
+        self.cache.delete("key")
+
+        self.assertIsNone(self.cache.get("key"))
+        self.assertIsNone(caches["openforms"].get("key"))
+
+    def test_add_uses_shared_cache(self):
+        self.assertTrue(self.cache.add("lock", True))
+        self.assertFalse(TwoLevelCache("openforms", local_timeout=10).add("lock", True))
+
+    @override_settings(
+        OPENFORMSCLIENT_CACHE_ALIAS="openforms",
+        OPENFORMSCLIENT_LOCAL_CACHE_TIMEOUT=10,
+    )
+    @patch(
+        "openformsclient.cache._fetch_forms",
+        lambda previous=None: CachedForms(["form"], None),
+    )
+    def test_forms_are_cached_locally(self):
+        two_level_cache = get_cache()
+        self.assertIsInstance(two_level_cache, TwoLevelCache)
+        self.assertIs(get_cache(), two_level_cache)
+
+        get_cached_forms()
+        self.assertEqual(get_cached_forms(), ["form"])
+
+        self.assertEqual(
+            two_level_cache.stats, {"local_hits": 1, "shared_hits": 0, "misses": 1}
+        )
@@ -0,0 +1,103 @@
+from unittest.mock import patch
+from urllib.parse import urljoin
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from openformsclient.circuitbreaker import CircuitBreaker, CircuitOpenError
+from openformsclient.client import Client
+
+
+def test_circuit_breaker_opens_after_threshold():
+    circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30)
+
+    circuit_breaker.before_request()
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+
+    circuit_breaker.before_request()
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.before_request()
+
+
+def test_circuit_breaker_success_resets_failures():
+    circuit_breaker = CircuitBreaker(failure_threshold=2)
+
+    circuit_breaker.record_failure()
+    circuit_breaker.record_success()
+    circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+    assert circuit_breaker.failures == 1
+
+
+def test_circuit_breaker_half_open_probe():
+    with patch("openformsclient.circuitbreaker.time.monotonic") as monotonic:
+        monotonic.return_value = 0
+        circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        circuit_breaker.record_failure()
+
+        monotonic.return_value = 30
+        assert circuit_breaker.state == CircuitBreaker.HALF_OPEN
+
+        # Only a single request is let through.
+        circuit_breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            circuit_breaker.before_request()
+
+        # A failed probe opens the circuit again.
+        circuit_breaker.record_failure()
+        assert circuit_breaker.state == CircuitBreaker.OPEN
+
+        monotonic.return_value = 60
+        circuit_breaker.before_request()
+        circuit_breaker.record_success()
+
+        assert circuit_breaker.state == CircuitBreaker.CLOSED
+        circuit_breaker.before_request()
+
+
+def test_circuit_breaker_disabled():
+    circuit_breaker = CircuitBreaker(failure_threshold=0)
+
+    for _ in range(10):
+        circuit_breaker.before_request()
+        circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_client_circuit_breaker(requests_mock):
+    client = Client("https://example.com/api/v1/", "token", 2, failure_threshold=2)
+    url = urljoin(client.api_root, "public/forms")
+    requests_mock.get(url, exc=ConnectionError)
+    requests_mock.head(url, status_code=503)
+
+    with pytest.raises(ConnectionError):
+        client.get_forms()
+    healthy, message = client.is_healthy()
+    assert not healthy
+
+    with pytest.raises(CircuitOpenError):
+        client.get_forms()
+    healthy, message = client.is_healthy()
+
+    assert not healthy
+    assert "The Open Forms API is unavailable after 2 failed requests" in message
+    # The HEAD request opened the circuit, so all later calls failed fast.
+    assert requests_mock.call_count == 2
+
+
+def test_client_circuit_breaker_ignores_client_errors(requests_mock):
+    client = Client("https://example.com/api/v1/", "token", 2, failure_threshold=1)
+    requests_mock.get(urljoin(client.api_root, "forms/bogus"), status_code=404)
+
+    for _ in range(2):
+        with pytest.raises(Exception) as exc_info:
+            client.get_form("bogus")
+        assert not isinstance(exc_info.value, CircuitOpenError)
+
+    assert client.circuit_breaker.state == CircuitBreaker.CLOSED
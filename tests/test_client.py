@@ -1,10 +1,12 @@
+from unittest.mock import patch
 from urllib.parse import urljoin
 
 import pytest
 import vcr
-from requests.exceptions import HTTPError
+from requests.exceptions import ConnectionError, HTTPError, InvalidURL, Timeout
 
-from openformsclient.client import Client
+from openformsclient.client import Client, Validators, get_next_page_url
+from openformsclient.models import Configuration
 
 from .data.forms import test_form
 
@@ -32,7 +34,7 @@ def test_client_is_healthy(client):
 
 @vcr.use_cassette(CASSETTE_PATH_FORMS, **VCR_DEFAULTS)
 def test_get_forms(client):
-    results = client.get_forms()["results"]
+    results = client.get_forms()
 
     assert test_form in results
 
@@ -71,3 +73,439 @@ def test_get_single_form_unauthorized(bogus_client):
 
     with pytest.raises(HTTPError, match=msg):
         bogus_client.get_form(uuid_or_slug=test_form["uuid"])
+
+
+def test_client_reuses_session(client, requests_mock):
+    requests_mock.get(urljoin(client.api_root, "public/forms"), json=[])
+
+    session = client.session
+    client.get_forms()
+    client.get_forms()
+
+    assert client.session is session
+    assert requests_mock.call_count == 2
+    assert (
+        requests_mock.last_request.headers["Authorization"]
+        == f"Token {client.api_token}"
+    )
+
+
+def test_client_session_pool_configuration():
+    client = Client(
+        "https://example.com/api/v1/",
+        "token",
+        2,
+        pool_connections=2,
+        pool_maxsize=20,
+    )
+
+    adapter = client.session.get_adapter(client.api_root)
+
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 20
+
+
+def test_client_session_does_not_keep_cookies(client, requests_mock):
+    requests_mock.get(
+        urljoin(client.api_root, "public/forms"),
+        json=[],
+        headers={"Set-Cookie": "openforms_sessionid=abc; Path=/"},
+    )
+
+    client.get_forms()
+
+    assert len(client.session.cookies) == 0
+
+
+def test_client_close(client):
+    session = client.session
+
+    client.close()
+
+    assert client.session is not session
+
+
+def test_get_form_summaries_if_modified(client, requests_mock):
+    url = urljoin(client.api_root, "public/forms")
+    requests_mock.get(
+        url,
+        [
+            {
+                "json": [test_form],
+                "headers": {
+                    "ETag": '"abc"',
+                    "Last-Modified": "Wed, 31 Jul 2024 09:12:34 GMT",
+                },
+            },
+            {"status_code": 304},
+        ],
+    )
+
+    forms, validators = client.get_form_summaries_if_modified()
+
+    assert [form.uuid for form in forms] == [test_form["uuid"]]
+    assert validators == Validators('"abc"', "Wed, 31 Jul 2024 09:12:34 GMT")
+    assert "If-None-Match" not in requests_mock.last_request.headers
+
+    forms, next_validators = client.get_form_summaries_if_modified(validators)
+
+    assert forms is None
+    assert next_validators == validators
+    assert requests_mock.last_request.headers["If-None-Match"] == '"abc"'
+    assert (
+        requests_mock.last_request.headers["If-Modified-Since"]
+        == "Wed, 31 Jul 2024 09:12:34 GMT"
+    )
+    assert requests_mock.last_request.headers["Authorization"]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_get_form_summaries_if_modified_changed(client, requests_mock, stream):
+    url = urljoin(client.api_root, "public/forms")
+    requests_mock.get(
+        url, json=[{**test_form, "name": "Changed"}], headers={"ETag": '"def"'}
+    )
+
+    forms, validators = client.get_form_summaries_if_modified(
+        Validators('"abc"', None), stream=stream
+    )
+
+    assert [form.name for form in forms] == ["Changed"]
+    assert validators == Validators('"def"', None)
+    assert requests_mock.last_request.headers["If-None-Match"] == '"abc"'
+    assert "If-Modified-Since" not in requests_mock.last_request.headers
+
+
+def test_get_form_summaries_if_modified_stream_not_modified(client, requests_mock):
+    requests_mock.get(urljoin(client.api_root, "public/forms"), status_code=304)
+
+    validators = Validators('"abc"', None)
+    result = client.get_form_summaries_if_modified(validators, stream=True)
+
+    assert result == (None, validators)
+
+
+def test_get_form_summaries_without_validators(client, requests_mock):
+    requests_mock.get(urljoin(client.api_root, "public/forms"), json=[test_form])
+
+    forms, validators = client.get_form_summaries_if_modified()
+
+    assert len(forms) == 1
+    assert validators is None
+
+
+@pytest.mark.django_db
+def test_get_forms_by_ids(client, requests_mock):
+    other_form = {**test_form, "uuid": "1b0d0675", "slug": "other"}
+    requests_mock.get(urljoin(client.api_root, "forms/other"), json=other_form)
+    requests_mock.get(urljoin(client.api_root, "forms/bogus"), status_code=404)
+    requests_mock.get(
+        urljoin(client.api_root, f"forms/{test_form['uuid']}"), json=test_form
+    )
+
+    results = client.get_forms_by_ids([test_form["uuid"], "other", "bogus", "other"])
+
+    assert results == {test_form["uuid"]: test_form, "other": other_form, "bogus": None}
+    assert requests_mock.call_count == 3
+
+    # Existing forms are cached.
+    results = client.get_forms_by_ids([test_form["uuid"], "other", "bogus"])
+
+    assert results["other"] == other_form
+    assert requests_mock.call_count == 4
+
+
+@pytest.mark.django_db
+def test_get_forms_by_ids_from_index(client, requests_mock):
+    Configuration.objects.create(api_root=client.api_root, api_token="token")
+    requests_mock.get(urljoin(client.api_root, "public/forms"), json=[test_form])
+    requests_mock.get(
+        urljoin(client.api_root, f"forms/{test_form['uuid']}"), json=test_form
+    )
+
+    results = client.get_forms_by_ids([test_form["slug"], test_form["uuid"]])
+
+    # The details are retrieved once, by UUID.
+    assert results == {test_form["slug"]: test_form, test_form["uuid"]: test_form}
+    assert requests_mock.call_count == 2
+
+    results = client.get_forms_by_ids([test_form["slug"]])
+
+    assert results == {test_form["slug"]: test_form}
+    assert requests_mock.call_count == 2
+
+
+def test_get_form_conditional_request(client, requests_mock):
+    requests_mock.get(
+        urljoin(client.api_root, f"forms/{test_form['uuid']}"),
+        [
+            {"json": test_form, "headers": {"ETag": '"abc"'}},
+            {"json": {**test_form, "name": "Changed"}, "headers": {"ETag": '"def"'}},
+            {"status_code": 304},
+        ],
+    )
+
+    client.get_form(test_form["uuid"])
+    assert "If-None-Match" not in requests_mock.last_request.headers
+
+    changed = client.get_form(test_form["uuid"])
+    assert requests_mock.last_request.headers["If-None-Match"] == '"abc"'
+
+    cached = client.get_form(test_form["uuid"])
+    assert requests_mock.last_request.headers["If-None-Match"] == '"def"'
+    assert changed["name"] == cached["name"] == "Changed"
+
+
+@pytest.mark.django_db
+@patch("openformsclient.client.time.monotonic")
+def test_get_forms_by_ids_conditional_request(mock_monotonic, client, requests_mock):
+    requests_mock.get(
+        urljoin(client.api_root, "forms/other"),
+        [
+            {
+                "json": test_form,
+                "headers": {"Last-Modified": "Wed, 31 Jul 2024 09:12:34 GMT"},
+            },
+            {"status_code": 304},
+        ],
+    )
+
+    mock_monotonic.return_value = 0
+    client.get_forms_by_ids(["other"])
+
+    mock_monotonic.return_value = 59
+    client.get_forms_by_ids(["other"])
+    assert requests_mock.call_count == 1
+
+    # The outdated form is retrieved again if it changed.
+    mock_monotonic.return_value = 60
+    results = client.get_forms_by_ids(["other"])
+
+    assert results == {"other": test_form}
+    assert requests_mock.call_count == 2
+    assert (
+        requests_mock.last_request.headers["If-Modified-Since"]
+        == "Wed, 31 Jul 2024 09:12:34 GMT"
+    )
+
+    # The form is fresh again.
+    mock_monotonic.return_value = 119
+    client.get_forms_by_ids(["other"])
+    assert requests_mock.call_count == 2
+
+
+@pytest.mark.django_db
+def test_get_forms_by_ids_error(client, requests_mock):
+    requests_mock.get(urljoin(client.api_root, "forms/other"), status_code=500)
+
+    with pytest.raises(HTTPError):
+        client.get_forms_by_ids(["other"])
+
+
+def test_client_timeouts():
+    client = Client("https://example.com/api/v1/", "token", 5)
+    assert client.timeout == (5, 5)
+
+    client = Client(
+        "https://example.com/api/v1/", "token", 5, connect_timeout=1, read_timeout=10
+    )
+    assert client.timeout == (1, 10)
+
+
+@patch("openformsclient.client.time.sleep")
+def test_client_retries(mock_sleep, requests_mock):
+    client = Client(
+        "https://example.com/api/v1/", "token", 2, max_retries=3, retry_backoff=0.5
+    )
+    requests_mock.get(
+        urljoin(client.api_root, "public/forms"),
+        [
+            {"exc": ConnectionError},
+            {"status_code": 503},
+            {"json": [test_form]},
+        ],
+    )
+
+    assert client.get_forms() == [test_form]
+    assert requests_mock.call_count == 3
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+    assert requests_mock.last_request.timeout == (2, 2)
+
+
+@patch("openformsclient.client.time.sleep")
+def test_client_retries_exhausted(mock_sleep, requests_mock):
+    client = Client("https://example.com/api/v1/", "token", 2, max_retries=1)
+    requests_mock.get(urljoin(client.api_root, "public/forms"), exc=Timeout)
+
+    with pytest.raises(Timeout):
+        client.get_forms()
+
+    assert requests_mock.call_count == 2
+
+
+@patch("openformsclient.client.time.sleep")
+def test_client_does_not_retry_unsafe_methods(mock_sleep, requests_mock):
+    client = Client("https://example.com/api/v1/", "token", 2, max_retries=3)
+    requests_mock.post(urljoin(client.api_root, "forms"), status_code=503)
+
+    response = client._request("post", "forms")
+
+    assert response.status_code == 503
+    assert requests_mock.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_client_deadline(requests_mock):
+    client = Client(
+        "https://example.com/api/v1/",
+        "token",
+        10,
+        deadline=3,
+        max_retries=3,
+        retry_backoff=4,
+    )
+    requests_mock.get(urljoin(client.api_root, "public/forms"), status_code=503)
+
+    with patch("openformsclient.client.time") as mock_time:
+        mock_time.monotonic.return_value = 0
+
+        with pytest.raises(Timeout):
+            client.get_forms()
+
+        # The first attempt gets the remaining time as timeout, and there is
+        # no time left for a retry after the backoff.
+        assert requests_mock.call_count == 1
+        assert requests_mock.last_request.timeout == (3, 3)
+        mock_time.sleep.assert_not_called()
+
+
+def _prepare_pages(requests_mock, api_root):
+    page_2 = urljoin(api_root, "public/forms?page=2")
+    requests_mock.get(
+        urljoin(api_root, "public/forms"),
+        json={"count": 2, "next": page_2, "previous": None, "results": [test_form]},
+    )
+    requests_mock.get(
+        page_2,
+        json={
+            "count": 2,
+            "next": None,
+            "previous": urljoin(api_root, "public/forms"),
+            "results": [{**test_form, "uuid": "1b0d0675", "slug": "other"}],
+        },
+    )
+
+
+def test_get_forms_paginated(client, requests_mock):
+    _prepare_pages(requests_mock, client.api_root)
+
+    results = client.get_forms()
+
+    assert [form["slug"] for form in results] == [test_form["slug"], "other"]
+    assert requests_mock.call_count == 2
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_get_form_summaries_if_modified_paginated(client, requests_mock, stream):
+    _prepare_pages(requests_mock, client.api_root)
+    requests_mock.get(
+        urljoin(client.api_root, "public/forms"),
+        complete_qs=True,
+        json={
+            "count": 2,
+            "next": urljoin(client.api_root, "public/forms?page=2"),
+            "previous": None,
+            "results": [test_form],
+        },
+        headers={"ETag": '"abc"'},
+    )
+
+    forms, validators = client.get_form_summaries_if_modified(stream=stream)
+
+    # Only the first page could be checked for changes.
+    assert len(forms) == 2
+    assert validators is None
+
+
+def test_iter_forms_paginated(client, requests_mock):
+    _prepare_pages(requests_mock, client.api_root)
+
+    forms = client.iter_forms(fields=["slug"])
+
+    assert next(forms) == {"slug": test_form["slug"]}
+    # The next page is only retrieved when needed.
+    assert requests_mock.call_count == 1
+    assert list(forms) == [{"slug": "other"}]
+    assert requests_mock.call_count == 2
+
+
+def test_iter_forms_paginated_prefetch(client, requests_mock):
+    _prepare_pages(requests_mock, client.api_root)
+
+    forms = client.iter_forms(fields=["slug"], prefetch=True)
+
+    assert list(forms) == [{"slug": test_form["slug"]}, {"slug": "other"}]
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.qs == {"page": ["2"]}
+
+
+def test_iter_forms_paginated_prefetch_closed_early(client, requests_mock):
+    _prepare_pages(requests_mock, client.api_root)
+
+    forms = client.iter_forms(fields=["slug"], prefetch=True)
+    next(forms)
+    forms.close()
+
+    assert requests_mock.call_count == 2
+
+
+def test_get_next_page_url():
+    api_root = "https://example.com/api/v1/"
+
+    assert (
+        get_next_page_url(api_root, "https://example.com/api/v1/public/forms?page=2")
+        == "https://example.com/api/v1/public/forms?page=2"
+    )
+    # Links of Open Forms behind a proxy get the scheme and port of the API root.
+    assert (
+        get_next_page_url(
+            api_root, "http://EXAMPLE.com:8000/api/v1/public/forms?page=2"
+        )
+        == "https://example.com/api/v1/public/forms?page=2"
+    )
+    assert (
+        get_next_page_url(api_root, "/api/v1/public/forms?page=2")
+        == "https://example.com/api/v1/public/forms?page=2"
+    )
+
+    with pytest.raises(InvalidURL):
+        get_next_page_url(api_root, "https://evil.example.org/api/v1/public/forms")
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_get_forms_paginated_other_scheme(client, requests_mock, stream):
+    _prepare_pages(requests_mock, client.api_root)
+    page_2 = urljoin(client.api_root, "public/forms?page=2")
+    requests_mock.get(
+        urljoin(client.api_root, "public/forms"),
+        complete_qs=True,
+        json={"next": page_2.replace("https://", "http://"), "results": [test_form]},
+    )
+
+    forms = client.get_form_summaries(stream=stream)
+
+    assert len(forms) == 2
+    assert requests_mock.last_request.url == page_2
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_get_forms_paginated_other_host(client, requests_mock, stream):
+    requests_mock.get(
+        urljoin(client.api_root, "public/forms"),
+        json={"next": "https://evil.example.org/forms?page=2", "results": [test_form]},
+    )
+
+    with pytest.raises(InvalidURL):
+        client.get_form_summaries(stream=stream)
+
+    assert requests_mock.call_count == 1
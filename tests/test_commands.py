@@ -0,0 +1,103 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.core.signals import request_started
+from django.test import TestCase, override_settings
+
+import requests_mock
+
+from openformsclient.apps import WARM_CACHE_DISPATCH_UID
+from openformsclient.cache import get_form_index, get_forms_cache_key
+from openformsclient.models import Configuration
+
+FORMS = [
+    {
+        "uuid": "1b0d0675-2caf-48e8-beda-c32c6732b63c",
+        "slug": "test-2",
+        "name": "Test 2",
+    },
+    {
+        "uuid": "f4423c99-6341-442e-aedc-b47779579f4d",
+        "slug": "test-1",
+        "name": "Test 1",
+    },
+]
+
+
+# As if the forms are cached in a cache like Redis.
+@patch(
+    "openformsclient.management.commands.openforms_warm_cache.is_shared_cache",
+    lambda: True,
+)
+@requests_mock.Mocker()
+class WarmCacheTests(TestCase):
+    def setUp(self):
+        self.config = Configuration.objects.create(
+            api_root="https://example.com/api/v1/",
+            api_token="token",
+        )
+
+    def test_warm_cache(self, m):
+        m.get(f"{self.config.api_root}public/forms", json=FORMS)
+        stdout = StringIO()
+
+        call_command("openforms_warm_cache", stdout=stdout)
+
+        self.assertIn("Cached 2 forms", stdout.getvalue())
+        self.assertIsNotNone(cache.get(get_forms_cache_key()))
+
+        get_form_index().get_choices(use_uuids=True)
+        self.assertEqual(m.call_count, 1)
+
+    def test_warm_cache_refreshes_cached_forms(self, m):
+        m.get(f"{self.config.api_root}public/forms", json=FORMS)
+
+        call_command("openforms_warm_cache", stdout=StringIO())
+        call_command("openforms_warm_cache", stdout=StringIO())
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_warm_cache_not_shared(self, m):
+        with patch(
+            "openformsclient.management.commands.openforms_warm_cache.is_shared_cache",
+            lambda: False,
+        ):
+            with self.assertRaisesMessage(CommandError, "not shared"):
+                call_command("openforms_warm_cache", stdout=StringIO())
+
+        self.assertEqual(m.call_count, 0)
+
+    def test_warm_cache_error(self, m):
+        m.get(f"{self.config.api_root}public/forms", status_code=500)
+
+        with self.assertRaises(CommandError):
+            call_command("openforms_warm_cache", stdout=StringIO())
+
+    @override_settings(OPENFORMSCLIENT_WARM_CACHE_ON_STARTUP=True)
+    @patch("openformsclient.cache.run_in_background", lambda func: func())
+    def test_warm_cache_on_startup(self, m):
+        m.get(f"{self.config.api_root}public/forms", json=FORMS)
+
+        apps.get_app_config("openformsclient").ready()
+        self.addCleanup(
+            request_started.disconnect, dispatch_uid=WARM_CACHE_DISPATCH_UID
+        )
+
+        # The cache is warmed on the first request, not while loading the app.
+        self.assertEqual(m.call_count, 0)
+
+        self.client.get("/")
+        self.client.get("/")
+
+        self.assertEqual(m.call_count, 1)
+        self.assertIsNotNone(cache.get(get_forms_cache_key()))
+
+    @patch("openformsclient.cache.run_in_background")
+    def test_no_warm_cache_on_startup(self, m, mock_run):
+        apps.get_app_config("openformsclient").ready()
+        self.client.get("/")
+
+        mock_run.assert_not_called()
@@ -0,0 +1,116 @@
+from uuid import UUID
+
+from openformsclient.index import FormIndex
+from openformsclient.summary import FormSummary
+
+FORMS = [
+    FormSummary("1b0d0675-2caf-48e8-beda-c32c6732b63c", "test-2", "Test 2"),
+    FormSummary("f4423c99-6341-442e-aedc-b47779579f4d", "test-1", "Test 1"),
+]
+
+
+def test_form_index_lookups():
+    index = FormIndex(FORMS)
+
+    assert len(index) == 2
+    assert index.slug_to_uuid("test-1") == "f4423c99-6341-442e-aedc-b47779579f4d"
+    assert index.uuid_to_slug("f4423c99-6341-442e-aedc-b47779579f4d") == "test-1"
+    assert index.uuid_to_slug(UUID("f4423c99-6341-442e-aedc-b47779579f4d")) == "test-1"
+    assert index.name_for("test-2") == "Test 2"
+    assert index.name_for("1b0d0675-2caf-48e8-beda-c32c6732b63c") == "Test 2"
+
+
+def test_form_index_unknown_form():
+    index = FormIndex(FORMS)
+
+    assert index.get("test-3") is None
+    assert index.slug_to_uuid("test-3") is None
+    assert index.uuid_to_slug("3285e94f-adae-4a5c-a467-30690a279364") is None
+    assert index.name_for("test-3") is None
+
+
+def test_form_index_get():
+    index = FormIndex(FORMS)
+
+    assert index.get("test-1") == FORMS[1]
+    assert list(index) == [index.get("test-2"), index.get("test-1")]
+
+
+def test_form_index_choices():
+    index = FormIndex(FORMS)
+
+    assert index.get_choices() == [("test-1", "Test 1"), ("test-2", "Test 2")]
+    assert index.get_choices(use_uuids=True) == [
+        ("f4423c99-6341-442e-aedc-b47779579f4d", "Test 1"),
+        ("1b0d0675-2caf-48e8-beda-c32c6732b63c", "Test 2"),
+    ]
+    assert index.get_choices() is index.get_choices()
+
+
+SEARCH_FORMS = [
+    FormSummary("1", "zorg", "Zorg"),
+    FormSummary("2", "aanvraag-parkeervergunning", "Aanvraag parkeervergunning"),
+    FormSummary("3", "ecole", "École inschrijving"),
+    FormSummary("4", "eend", "Eend melden"),
+    FormSummary("5", "melding-openbare-ruimte", "Melding openbare ruimte"),
+    FormSummary("6", "ebook", "ebook lenen"),
+]
+
+
+def test_form_index_choices_ignore_accents_and_case():
+    index = FormIndex(SEARCH_FORMS)
+
+    assert [name for _slug, name in index.get_choices()] == [
+        "Aanvraag parkeervergunning",
+        "ebook lenen",
+        "École inschrijving",
+        "Eend melden",
+        "Melding openbare ruimte",
+        "Zorg",
+    ]
+
+
+def test_form_index_search_prefix():
+    index = FormIndex(SEARCH_FORMS)
+
+    assert [form.uuid for form in index.search("mel")] == ["4", "5"]
+    assert [form.uuid for form in index.search("ECOLE")] == ["3"]
+    assert [form.uuid for form in index.search("melding open")] == ["5"]
+    assert [form.uuid for form in index.search("parkeer")] == ["2"]
+
+
+def test_form_index_search_substring():
+    index = FormIndex(SEARCH_FORMS)
+
+    assert [form.uuid for form in index.search("vraag")] == ["2"]
+    assert [form.uuid for form in index.search("ing")] == ["2", "3", "5"]
+    # Prefix matches come before other matches.
+    assert [form.uuid for form in index.search("e")] == ["6", "3", "4", "2", "5"]
+
+
+def test_form_index_search_limit():
+    index = FormIndex(SEARCH_FORMS)
+
+    assert len(index.search("e", limit=2)) == 2
+    assert len(index.search("", limit=3)) == 3
+    assert [form.uuid for form in index.search("")] == ["2", "6", "3", "4", "5", "1"]
+    assert index.search("unknown") == []
+
+
+def test_form_index_search_empty():
+    assert FormIndex([]).search("test") == []
+
+
+def test_form_index_search_many_matches():
+    forms = [
+        FormSummary(str(i), f"form-{i}", f"{word} {i}")
+        for i, word in enumerate(["aanvraag", "afspraak", "melding", "bezwaar"] * 50)
+    ]
+    index = FormIndex(forms)
+
+    # Forms are found with the prefix of many words, or few words.
+    for query in ("a", "form", "melding 1", "bezwaar 19"):
+        results = index.search(query)
+        assert results
+        for limit in (1, 5, 21):
+            assert index.search(query, limit=limit) == results[:limit]
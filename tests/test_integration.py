@@ -1,12 +1,15 @@
 import datetime
+from unittest.mock import patch
 from uuid import UUID
 
+from django.core.cache import cache
 from django.forms import modelform_factory
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 import requests_mock
 import time_machine
 
+from openformsclient.cache import CachedForms, get_cached_forms, get_forms_cache_key
 from openformsclient.models import Configuration
 from testapp.models import Page
 
@@ -132,6 +135,7 @@ class IntegrationTests(TestCase):
         self.assertEqual(Page.objects.count(), 1)
         self.assertEqual(Page.objects.get().form_slug, "")
 
+    @patch("openformsclient.cache.run_in_background", lambda func: func())
     def test_form_retrieval_cache(self, m):
         self._prepare_mock(m)
 
@@ -149,3 +153,202 @@ class IntegrationTests(TestCase):
             list(page_form.fields["form_slug"].choices)
 
             self.assertEqual(m.call_count, 2)
+
+    def test_form_retrieval_cache_serves_stale_choices(self, m):
+        self._prepare_mock(m)
+
+        PageForm = modelform_factory(Page, fields=["form_slug"])
+        page_form = PageForm()
+
+        with time_machine.travel(0) as traveller:
+            list(page_form.fields["form_slug"].choices)
+
+            m.get(
+                f"{self.config.api_root}public/forms",
+                json=[{"uuid": "f4423c99", "slug": "test-3", "name": "Test 3"}],
+            )
+            traveller.shift(datetime.timedelta(seconds=60))
+
+            with patch("openformsclient.cache.run_in_background") as mock_run:
+                choices = list(page_form.fields["form_slug"].choices)
+                # A second evaluation does not schedule another refresh.
+                list(page_form.fields["form_slug"].choices)
+
+            self.assertEqual(mock_run.call_count, 1)
+            self.assertEqual(m.call_count, 1)
+            self.assertIn(("test-1", "Test 1"), choices)
+
+            # Refresh in the background.
+            mock_run.call_args.args[0]()
+
+            self.assertEqual(m.call_count, 2)
+            self.assertListEqual(
+                list(page_form.fields["form_slug"].choices),
+                [("", "---------"), ("test-3", "Test 3")],
+            )
+
+    @patch("openformsclient.cache.run_in_background", lambda func: func())
+    def test_form_retrieval_cache_keeps_stale_choices_on_error(self, m):
+        self._prepare_mock(m)
+
+        PageForm = modelform_factory(Page, fields=["form_slug"])
+        page_form = PageForm()
+
+        with time_machine.travel(0) as traveller:
+            list(page_form.fields["form_slug"].choices)
+
+            m.get(f"{self.config.api_root}public/forms", status_code=500)
+            traveller.shift(datetime.timedelta(seconds=60))
+
+            list(page_form.fields["form_slug"].choices)
+            self.assertEqual(m.call_count, 2)
+
+            self.assertListEqual(
+                list(page_form.fields["form_slug"].choices),
+                [
+                    ("", "---------"),
+                    ("test-1", "Test 1"),
+                    ("test-2", "Test 2"),
+                ],
+            )
+
+    @patch("openformsclient.cache.run_in_background", lambda func: func())
+    def test_form_retrieval_cache_conditional_request(self, m):
+        m.get(
+            f"{self.config.api_root}public/forms",
+            [
+                {
+                    "json": [{"uuid": "f4423c99", "slug": "test-1", "name": "Test 1"}],
+                    "headers": {"ETag": '"abc"'},
+                },
+                {"status_code": 304},
+            ],
+        )
+
+        PageForm = modelform_factory(Page, fields=["form_slug"])
+        page_form = PageForm()
+
+        with time_machine.travel(0) as traveller:
+            list(page_form.fields["form_slug"].choices)
+
+            traveller.shift(datetime.timedelta(seconds=60))
+            list(page_form.fields["form_slug"].choices)
+
+            self.assertEqual(m.call_count, 2)
+            self.assertEqual(m.last_request.headers["If-None-Match"], '"abc"')
+
+            # The unchanged forms are fresh again.
+            traveller.shift(datetime.timedelta(seconds=59))
+            choices = list(page_form.fields["form_slug"].choices)
+
+        self.assertEqual(m.call_count, 2)
+        self.assertListEqual(choices, [("", "---------"), ("test-1", "Test 1")])
+
+    def test_form_retrieval_waits_for_other_worker(self, m):
+        self._prepare_mock(m)
+        key = get_forms_cache_key()
+        # Another worker is retrieving the forms.
+        cache.add(f"{key}__lock", True)
+
+        def finish_other_worker(seconds):
+            cache.set(key, (CachedForms(["form"], None), 0))
+
+        with patch("openformsclient.cache.time.sleep", finish_other_worker):
+            self.assertEqual(get_cached_forms(), ["form"])
+
+        self.assertEqual(m.call_count, 0)
+
+    @patch("openformsclient.cache.COLD_CACHE_WAIT", 0)
+    def test_form_retrieval_stops_waiting_for_other_worker(self, m):
+        self._prepare_mock(m)
+        cache.add(f"{get_forms_cache_key()}__lock", True)
+
+        PageForm = modelform_factory(Page, fields=["form_slug"])
+        page_form = PageForm()
+
+        self.assertListEqual(list(page_form.fields["form_slug"].choices), [])
+        self.assertEqual(m.call_count, 0)
+
+    @override_settings(OPENFORMSCLIENT_FORMS_CACHE_TIMEOUT=300)
+    @patch("openformsclient.cache.run_in_background", lambda func: func())
+    def test_form_retrieval_cache_timeout_setting(self, m):
+        self._prepare_mock(m)
+
+        PageForm = modelform_factory(Page, fields=["form_slug"])
+        page_form = PageForm()
+
+        with time_machine.travel(0) as traveller:
+            list(page_form.fields["form_slug"].choices)
+
+            traveller.shift(datetime.timedelta(seconds=299))
+            list(page_form.fields["form_slug"].choices)
+            self.assertEqual(m.call_count, 1)
+
+            traveller.shift(datetime.timedelta(seconds=1))
+            list(page_form.fields["form_slug"].choices)
+            self.assertEqual(m.call_count, 2)
+
+    @override_settings(OPENFORMSCLIENT_STREAM_FORMS=True)
+    def test_values_in_form_field_streamed(self, m):
+        self._prepare_mock(m)
+
+        PageForm = modelform_factory(Page, fields=["form_slug"])
+        page_form = PageForm()
+
+        self.assertListEqual(
+            list(page_form.fields["form_slug"].choices),
+            [
+                ("", "---------"),
+                ("test-1", "Test 1"),
+                ("test-2", "Test 2"),
+            ],
+        )
+
+    def test_form_retrieval_cache_shared_by_fields(self, m):
+        self._prepare_mock(m)
+
+        PageForm = modelform_factory(Page, fields=["form_slug", "form_uuid"])
+        page_form = PageForm()
+
+        list(page_form.fields["form_slug"].choices)
+        list(page_form.fields["form_uuid"].choices)
+
+        self.assertEqual(m.call_count, 1)
+
+    def test_form_retrieval_cache_cleared_on_configuration_change(self, m):
+        self._prepare_mock(m)
+
+        PageForm = modelform_factory(Page, fields=["form_slug"])
+        page_form = PageForm()
+
+        list(page_form.fields["form_slug"].choices)
+        self.config.save()
+        list(page_form.fields["form_slug"].choices)
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_form_descriptor(self, m):
+        self._prepare_mock(m)
+
+        page = Page(
+            form_slug="test-1", form_uuid="1b0d0675-2caf-48e8-beda-c32c6732b63c"
+        )
+
+        self.assertEqual(page.form_slug_form.name, "Test 1")
+        self.assertEqual(
+            page.form_slug_form.uuid, "f4423c99-6341-442e-aedc-b47779579f4d"
+        )
+        self.assertEqual(page.form_uuid_form.slug, "test-2")
+        self.assertEqual(m.call_count, 1)
+
+    def test_form_descriptor_unknown_or_empty(self, m):
+        self._prepare_mock(m)
+
+        self.assertIsNone(Page(form_slug="test-3").form_slug_form)
+        self.assertIsNone(Page(form_slug="").form_slug_form)
+        self.assertIsNone(Page(form_uuid=None).form_uuid_form)
+
+    def test_form_descriptor_api_error(self, m):
+        m.get(f"{self.config.api_root}public/forms", status_code=500)
+
+        self.assertIsNone(Page(form_slug="test-1").form_slug_form)
@@ -0,0 +1,49 @@
+from unittest.mock import patch
+
+from openformsclient.lru import LRUCache
+
+
+def test_lru_cache_get_set():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("b", 2) == 2
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_lru_cache_timeout():
+    with patch("openformsclient.lru.time.monotonic", return_value=0) as monotonic:
+        cache = LRUCache(timeout=10)
+        cache.set("a", 1)
+        cache.set("b", 2, timeout=20)
+
+        monotonic.return_value = 10
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+
+def test_lru_cache_delete_and_clear():
+    cache = LRUCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.delete("a")
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert len(cache) == 0
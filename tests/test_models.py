@@ -1,10 +1,16 @@
+from unittest.mock import patch
+
 from django.contrib import admin
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.forms import modelform_factory
 from django.forms.widgets import Select
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
+from openformsclient.index import FormIndex
 from openformsclient.models import Configuration, OpenFormsSlugField, OpenFormsUUIDField
+from openformsclient.summary import FormSummary
+from openformsclient.widgets import OpenFormsAutocompleteWidget
 
 
 class Dummy(models.Model):
@@ -31,6 +37,35 @@ class ConfigurationTests(TestCase):
         self.assertEqual(client.api_root, self.config.api_root)
         self.assertEqual(client.api_token, self.config.api_token)
 
+    def test_client_is_reused(self):
+        self.config.api_root = "https://example.com/api/v1/"
+        self.config.api_token = "token"
+        self.config.save()
+
+        client = self.config.client
+
+        self.assertIs(Configuration.get_solo().client, client)
+
+    def test_client_is_replaced_on_change(self):
+        self.config.api_root = "https://example.com/api/v1/"
+        self.config.api_token = "token"
+        client = self.config.client
+
+        self.config.api_token = "other-token"
+
+        self.assertIsNot(self.config.client, client)
+        self.assertEqual(self.config.client.api_token, "other-token")
+
+    def test_client_is_invalidated_on_save(self):
+        self.config.api_root = "https://example.com/api/v1/"
+        self.config.api_token = "token"
+        self.config.save()
+        client = self.config.client
+
+        self.config.save()
+
+        self.assertIsNot(self.config.client, client)
+
     def test_save_updates_api_endpoint(self):
         self.config.api_root = "https://example.com/api/v5"
         self.config.save()
@@ -39,6 +74,14 @@ class ConfigurationTests(TestCase):
 
         self.assertEqual(self.config.api_root, "https://example.com/api/v5/")
 
+    def test_negative_retry_backoff_is_invalid(self):
+        self.config.retry_backoff = -1
+
+        with self.assertRaises(ValidationError) as cm:
+            self.config.full_clean()
+
+        self.assertIn("retry_backoff", cm.exception.message_dict)
+
 
 class OpenFormsFieldTests(TestCase):
     def test_slug_form_field_widget(self):
@@ -70,3 +113,38 @@ class OpenFormsFieldTests(TestCase):
         )
 
         self.assertIsInstance(form_field.widget, Select)
+
+    @override_settings(OPENFORMSCLIENT_AUTOCOMPLETE=True)
+    def test_autocomplete_widget(self):
+        DummyForm = modelform_factory(Dummy, fields=["form_slug", "form_uuid"])
+        form = DummyForm()
+
+        self.assertIsInstance(
+            form.fields["form_slug"].widget, OpenFormsAutocompleteWidget
+        )
+        self.assertFalse(form.fields["form_slug"].widget.use_uuids)
+        self.assertTrue(form.fields["form_uuid"].widget.use_uuids)
+
+    @override_settings(OPENFORMSCLIENT_AUTOCOMPLETE=True)
+    @patch("openformsclient.widgets.get_form_index")
+    @patch("openformsclient.models.get_form_index")
+    def test_autocomplete_widget_renders_selected_form(
+        self, mock_index, mock_widget_index
+    ):
+        mock_index.return_value = mock_widget_index.return_value = FormIndex(
+            [
+                FormSummary("1b0d0675-2caf-48e8-beda-c32c6732b63c", "test-2", "Test 2"),
+                FormSummary("f4423c99-6341-442e-aedc-b47779579f4d", "test-1", "Test 1"),
+            ]
+        )
+        DummyForm = modelform_factory(Dummy, fields=["form_slug"])
+
+        html = DummyForm(initial={"form_slug": "test-1"})["form_slug"].as_widget()
+
+        self.assertIn('<option value="test-1" selected>Test 1</option>', html)
+        self.assertNotIn("test-2", html)
+        self.assertIn('data-ajax--url="/openforms/forms/autocomplete"', html)
+
+        # The submitted value is still validated against all forms.
+        self.assertTrue(DummyForm(data={"form_slug": "test-2"}).is_valid())
+        self.assertFalse(DummyForm(data={"form_slug": "test-3"}).is_valid())
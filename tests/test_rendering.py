@@ -0,0 +1,102 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.template import Context, Template
+from django.template.loader import render_to_string
+from django.test import TestCase, override_settings
+
+from openformsclient.models import Configuration
+from openformsclient.rendering import (
+    FORM_TEMPLATE_NAME,
+    FormRenderer,
+    uses_own_form_template,
+)
+from openformsclient.snapshot import ConfigurationSnapshot
+
+
+class FormRendererTests(TestCase):
+    def setUp(self):
+        self.config = ConfigurationSnapshot.from_configuration(
+            Configuration(api_root="https://forms.example.com/api/v1/?a=1&b=2")
+        )
+
+    def test_renders_like_template(self):
+        renderer = FormRenderer(self.config)
+        cases = [
+            {"form_id": "my-form", "html_id": "openforms-root"},
+            {
+                "form_id": "f4423c99-6341-442e-aedc-b47779579f4d",
+                "html_id": "root-2",
+                "base_path": "/page/test",
+                "csp_nonce": "nonce",
+                "lang": "nl",
+            },
+            {"form_id": '"><script>', "html_id": "a'b", "csp_nonce": "<nonce>"},
+            {"form_id": None, "html_id": "root", "base_path": ""},
+            {"form_id": "my-form", "html_id": "root", "defer_init": True},
+            {
+                "form_id": "my-form",
+                "html_id": "root",
+                "csp_nonce": "nonce",
+                "defer_init": True,
+            },
+        ]
+
+        for kwargs in cases:
+            with self.subTest(kwargs=kwargs):
+                expected = render_to_string(
+                    FORM_TEMPLATE_NAME, {"base_url": self.config.api_root, **kwargs}
+                )
+
+                self.assertEqual(renderer.render(**kwargs), expected)
+
+    @patch("openformsclient.rendering.get_sentry_context")
+    def test_renders_sentry_like_template(self, mock_sentry_context):
+        mock_sentry_context.return_value = {
+            "sentry_dsn": "https://key@sentry.example.com/1",
+            "sentry_env": "test & acceptance",
+        }
+
+        result = FormRenderer(self.config).render("my-form", "root")
+
+        self.assertEqual(
+            result,
+            render_to_string(
+                FORM_TEMPLATE_NAME,
+                {
+                    "base_url": self.config.api_root,
+                    "form_id": "my-form",
+                    "html_id": "root",
+                    **mock_sentry_context.return_value,
+                },
+            ),
+        )
+
+    def test_uses_own_form_template(self):
+        self.assertTrue(uses_own_form_template())
+        self.assertTrue(FormRenderer(self.config).enabled)
+
+    def test_overridden_form_template(self):
+        with tempfile.TemporaryDirectory() as templates_dir:
+            path = os.path.join(templates_dir, FORM_TEMPLATE_NAME)
+            os.makedirs(os.path.dirname(path))
+            with open(path, "w") as f:
+                f.write('<div class="custom" id="{{ html_id }}"></div>')
+
+            templates = [
+                {
+                    "BACKEND": "django.template.backends.django.DjangoTemplates",
+                    "DIRS": [templates_dir],
+                    "APP_DIRS": True,
+                }
+            ]
+            with override_settings(TEMPLATES=templates):
+                self.assertFalse(uses_own_form_template())
+                self.assertFalse(FormRenderer(self.config).enabled)
+
+                result = Template(
+                    "{% load openforms %}{% openforms_form 'my-form' %}"
+                ).render(Context())
+
+        self.assertEqual(result, '<div class="custom" id="openforms-root"></div>')
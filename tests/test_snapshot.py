@@ -0,0 +1,128 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from openformsclient.models import Configuration
+from openformsclient.snapshot import (
+    CONFIGURATION_VERSION_KEY,
+    ConfigurationSnapshot,
+    get_configuration_snapshot,
+)
+
+
+class ConfigurationSnapshotTests(TestCase):
+    def setUp(self):
+        self.config = Configuration.objects.create(
+            api_root="https://example.com/api/v1/",
+            api_token="token",
+            sdk_js_url="https://example.com/sdk.js",
+        )
+
+    def test_snapshot(self):
+        snapshot = get_configuration_snapshot()
+
+        self.assertEqual(snapshot.api_root, "https://example.com/api/v1/")
+        self.assertEqual(snapshot.api_token, "token")
+        self.assertEqual(snapshot.sdk_js_url, "https://example.com/sdk.js")
+        self.assertEqual(snapshot.client.api_root, "https://example.com/api/v1/")
+        self.assertIs(snapshot.client, self.config.client)
+
+    def test_snapshot_is_immutable(self):
+        snapshot = get_configuration_snapshot()
+
+        with self.assertRaises(AttributeError):
+            snapshot.api_token = "other"
+
+    # As if the configuration version is kept in a cache like Redis.
+    @patch("openformsclient.snapshot.is_shared_cache", return_value=True)
+    def test_snapshot_is_reused(self, mock_shared):
+        snapshot = get_configuration_snapshot()
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_configuration_snapshot(), snapshot)
+
+    @override_settings(OPENFORMSCLIENT_CONFIGURATION_MAX_AGE=60)
+    @patch("openformsclient.snapshot.is_shared_cache", return_value=True)
+    @patch("openformsclient.snapshot.time.monotonic")
+    def test_snapshot_expires(self, mock_monotonic, mock_shared):
+        mock_monotonic.return_value = 0
+        get_configuration_snapshot()
+        # The change of the version was missed.
+        Configuration.objects.update(api_token="other")
+
+        mock_monotonic.return_value = 59
+        self.assertEqual(get_configuration_snapshot().api_token, "token")
+
+        mock_monotonic.return_value = 60
+        self.assertEqual(get_configuration_snapshot().api_token, "other")
+
+    def test_snapshot_is_not_reused_with_local_memory_cache(self):
+        # Other processes don't see the version of this process.
+        get_configuration_snapshot()
+        Configuration.objects.update(api_token="other")
+
+        self.assertEqual(get_configuration_snapshot().api_token, "other")
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    )
+    def test_snapshot_is_replaced_on_save_with_dummy_cache(self):
+        get_configuration_snapshot()
+
+        self.config.api_root = "https://example.com/api/v2/"
+        self.config.save()
+
+        self.assertEqual(
+            get_configuration_snapshot().api_root, "https://example.com/api/v2/"
+        )
+
+    def test_snapshot_is_replaced_on_save(self):
+        snapshot = get_configuration_snapshot()
+
+        self.config.api_token = "other"
+        self.config.save()
+
+        self.assertIsNot(get_configuration_snapshot(), snapshot)
+        self.assertEqual(get_configuration_snapshot().api_token, "other")
+
+    def test_snapshot_is_replaced_when_version_is_changed(self):
+        # Another process saves the configuration.
+        snapshot = get_configuration_snapshot()
+        Configuration.objects.update(api_token="other")
+        cache.set(CONFIGURATION_VERSION_KEY, "other")
+
+        self.assertEqual(get_configuration_snapshot().api_token, "other")
+        self.assertIsNot(get_configuration_snapshot(), snapshot)
+
+    def test_snapshot_is_replaced_when_version_is_evicted(self):
+        get_configuration_snapshot()
+        Configuration.objects.update(api_token="other")
+        cache.delete(CONFIGURATION_VERSION_KEY)
+
+        self.assertEqual(get_configuration_snapshot().api_token, "other")
+
+    def test_version_is_changed_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            with transaction.atomic():
+                self.config.save()
+
+        version = cache.get(CONFIGURATION_VERSION_KEY)
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertNotEqual(cache.get(CONFIGURATION_VERSION_KEY), version)
+
+    @override_settings(OPENFORMSCLIENT_LOCAL_CACHE_TIMEOUT=60)
+    def test_version_is_not_cached_locally(self):
+        get_configuration_snapshot()
+        cache.set(CONFIGURATION_VERSION_KEY, "other")
+        Configuration.objects.update(api_token="other")
+
+        self.assertEqual(get_configuration_snapshot().api_token, "other")
+
+    def test_from_configuration(self):
+        snapshot = ConfigurationSnapshot.from_configuration(self.config)
+
+        self.assertEqual(snapshot.api_root, self.config.api_root)
+        self.assertEqual(snapshot.use_sentry, self.config.use_sentry)
@@ -0,0 +1,90 @@
+import json
+from io import BytesIO
+from unittest.mock import patch
+from urllib.parse import urljoin
+
+import pytest
+
+from openformsclient.streaming import iter_projected_items
+
+FORMS = [
+    {
+        "uuid": "1b0d0675-2caf-48e8-beda-c32c6732b63c",
+        "slug": "test-2",
+        "name": "Test 2",
+        "active": True,
+        "loginOptions": [{"identifier": "digid", "name": "DigiD"}],
+        "literals": {"beginText": {"value": "Start", "resolved": "Start"}},
+    },
+    {
+        "uuid": "f4423c99-6341-442e-aedc-b47779579f4d",
+        "slug": "test-1",
+        "name": "Test 1",
+        "active": False,
+        "loginOptions": [],
+        "literals": {"beginText": {"value": "", "resolved": "Begin"}},
+    },
+]
+EXPECTED = [
+    {"uuid": "1b0d0675-2caf-48e8-beda-c32c6732b63c", "name": "Test 2"},
+    {"uuid": "f4423c99-6341-442e-aedc-b47779579f4d", "name": "Test 1"},
+]
+
+
+@pytest.fixture(params=[True, False], ids=["ijson", "json"])
+def use_ijson(request):
+    if request.param:
+        yield
+    else:
+        with patch("openformsclient.streaming.ijson", None):
+            yield
+
+
+def test_iter_projected_items_list(use_ijson):
+    fileobj = BytesIO(json.dumps(FORMS).encode())
+
+    result = list(iter_projected_items(fileobj, ["uuid", "name"]))
+
+    assert result == EXPECTED
+
+
+def test_iter_projected_items_paginated(use_ijson):
+    fileobj = BytesIO(json.dumps({"count": 2, "next": None, "results": FORMS}).encode())
+
+    result = list(iter_projected_items(fileobj, ["uuid", "name"]))
+
+    assert result == EXPECTED
+
+
+def test_iter_projected_items_only_scalars(use_ijson):
+    fileobj = BytesIO(json.dumps(FORMS).encode())
+
+    result = list(iter_projected_items(fileobj, ["slug", "active", "loginOptions"]))
+
+    assert result == [
+        {"slug": "test-2", "active": True},
+        {"slug": "test-1", "active": False},
+    ]
+
+
+def test_iter_projected_items_empty(use_ijson):
+    assert list(iter_projected_items(BytesIO(b"[]"), ["uuid"])) == []
+
+
+def test_client_iter_forms(client, requests_mock):
+    requests_mock.get(urljoin(client.api_root, "public/forms"), json=FORMS)
+
+    result = list(client.iter_forms(fields=["uuid", "slug", "name"]))
+
+    assert result == [
+        {
+            "uuid": "1b0d0675-2caf-48e8-beda-c32c6732b63c",
+            "slug": "test-2",
+            "name": "Test 2",
+        },
+        {
+            "uuid": "f4423c99-6341-442e-aedc-b47779579f4d",
+            "slug": "test-1",
+            "name": "Test 1",
+        },
+    ]
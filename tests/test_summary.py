@@ -0,0 +1,61 @@
+import pickle
+from urllib.parse import urljoin
+
+from openformsclient.summary import FormSummary
+
+FORM = {
+    "uuid": "1b0d0675-2caf-48e8-beda-c32c6732b63c",
+    "name": "Test 2",
+    "internalName": "",
+    "slug": "test-2",
+    "url": "https://example.com/api/v1/forms/1b0d0675-2caf-48e8-beda-c32c6732b63c",
+    "active": False,
+    "maintenanceMode": True,
+    "loginRequired": False,
+    "loginOptions": [
+        {
+            "identifier": "digid",
+            "label": "DigiD",
+            "url": "https://example.com/auth/digid/start",
+            "logo": {"title": "DigiD", "imageSrc": "https://example.com/digid.png"},
+        }
+    ],
+    "literals": {
+        "beginText": {"value": "", "resolved": "Begin"},
+        "previousText": {"value": "", "resolved": "Vorige"},
+    },
+}
+
+
+def test_form_summary_from_api():
+    summary = FormSummary.from_api(FORM)
+
+    assert summary == FormSummary(
+        uuid="1b0d0675-2caf-48e8-beda-c32c6732b63c",
+        slug="test-2",
+        name="Test 2",
+        active=False,
+        maintenance_mode=True,
+    )
+
+
+def test_form_summary_from_api_defaults():
+    summary = FormSummary.from_api({"uuid": "1", "slug": "test", "name": "Test"})
+
+    assert summary.active
+    assert not summary.maintenance_mode
+
+
+def test_form_summary_is_smaller_when_pickled():
+    forms = [{**FORM, "uuid": str(i), "slug": f"test-{i}"} for i in range(100)]
+    summaries = [FormSummary.from_api(form) for form in forms]
+
+    assert len(pickle.dumps(summaries)) < len(pickle.dumps(forms))
+    assert pickle.loads(pickle.dumps(summaries)) == summaries
+
+
+def test_client_get_form_summaries(client, requests_mock):
+    requests_mock.get(urljoin(client.api_root, "public/forms"), json=[FORM])
+
+    assert client.get_form_summaries() == [FormSummary.from_api(FORM)]
+    assert client.get_form_summaries(stream=True) == [FormSummary.from_api(FORM)]
@@ -1,10 +1,14 @@
 import sys
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from django.template import Context, Template
-from django.test import TestCase
+from django.template import Context, Template, TemplateSyntaxError
+from django.test import RequestFactory, TestCase
+
+from asgiref.sync import sync_to_async
 
 from openformsclient.models import Configuration
+from openformsclient.snapshot import ConfigurationSnapshot
+from openformsclient.templatetags.openforms import aget_configuration
 
 
 class TemplateTagsTests(TestCase):
@@ -114,6 +118,71 @@ class TemplateTagsTests(TestCase):
         if sentry_sdk is not None:
             sys.modules["sentry_sdk"] = sentry_sdk
 
+    def test_openforms_form_deferred(self):
+        html = """
+        {% load openforms %}
+        {% openforms_form "form-1" defer_init=True %}
+        {% openforms_form "form-2" defer_init=True %}
+        {% openforms_form "form-3" defer_init=True html_id="custom" %}
+        {% openforms_bootstrap csp_nonce="nonce" %}
+        """
+        result = Template(html).render(Context())
+
+        self.assertIn('id="openforms-root"', result)
+        self.assertIn('id="openforms-root-2"', result)
+        self.assertIn('id="custom"', result)
+        self.assertEqual(result.count("<script"), 1)
+        self.assertIn('<script nonce="nonce">', result)
+        self.assertIn('["openforms-root", "openforms-root-2", "custom"]', result)
+        self.assertEqual(result.count("form.init()"), 1)
+
+    def test_openforms_form_deferred_on_request(self):
+        request = RequestFactory().get("/")
+        Template(
+            '{% load openforms %}{% openforms_form "form-1" defer_init=True %}'
+        ).render(Context({"request": request}))
+
+        result = Template(
+            '{% load openforms %}{% openforms_form "form-2" defer_init=True %}'
+            "{% openforms_bootstrap %}"
+        ).render(Context({"request": request}))
+
+        self.assertIn('id="openforms-root-2"', result)
+        self.assertIn('["openforms-root", "openforms-root-2"]', result)
+
+    def test_openforms_bootstrap_initializes_forms_once(self):
+        html = """
+        {% load openforms %}
+        {% openforms_form "form-1" defer_init=True %}
+        {% openforms_bootstrap %}
+        {% openforms_bootstrap %}
+        """
+        result = Template(html).render(Context())
+
+        self.assertEqual(result.count("<script"), 1)
+
+    def test_openforms_bootstrap_without_deferred_forms(self):
+        html = """
+        {% load openforms %}
+        {% openforms_form "form-1" %}
+        {% openforms_bootstrap %}
+        """
+        result = Template(html).render(Context())
+
+        self.assertEqual(result.count("<script"), 1)
+        self.assertIn("getElementById('openforms-root')", result)
+
+    def test_openforms_bootstrap_escapes_html_ids(self):
+        html = """
+        {% load openforms %}
+        {% openforms_form "form-1" defer_init=True html_id=html_id %}
+        {% openforms_bootstrap %}
+        """
+        result = Template(html).render(Context({"html_id": "</script>"}))
+
+        self.assertEqual(result.count("</script>"), 1)
+        self.assertIn('["\\u003C/script\\u003E"]', result)
+
     def test_openforms_sdk_css(self):
         html = """
         {% load openforms %}
@@ -141,3 +210,164 @@ class TemplateTagsTests(TestCase):
 
         self.assertIn(f'href="{self.config.sdk_css_url}"', result)
         self.assertIn(f'src="{self.config.sdk_js_url}"', result)
+
+    def test_configuration_is_loaded_once_per_render(self):
+        html = """
+        {% load openforms %}
+        {% openforms_sdk_media %}
+        {% openforms_sdk_css %}
+        {% openforms_sdk_js %}
+        {% openforms_form myform %}
+        """
+        form_id = "f4423c99-6341-442e-aedc-b47779579f4d"
+
+        with self.assertNumQueries(1):
+            result = Template(html).render(Context({"myform": form_id}))
+
+        self.assertIn(f'data-form-id="{form_id}"', result)
+
+    def test_configuration_is_loaded_once_per_request(self):
+        request = RequestFactory().get("/")
+        html = """
+        {% load openforms %}
+        {% openforms_sdk_media %}
+        """
+
+        with self.assertNumQueries(1):
+            Template(html).render(Context({"request": request}))
+            Template(html).render(Context({"request": request}))
+
+    # As if the configuration version is kept in a cache like Redis.
+    @patch("openformsclient.snapshot.is_shared_cache", return_value=True)
+    def test_configuration_is_not_loaded_for_next_requests(self, mock_shared):
+        html = """
+        {% load openforms %}
+        {% openforms_sdk_media %}
+        """
+        Template(html).render(Context({"request": RequestFactory().get("/")}))
+
+        with self.assertNumQueries(0):
+            result = Template(html).render(
+                Context({"request": RequestFactory().get("/")})
+            )
+
+        self.assertIn(f'href="{self.config.sdk_css_url}"', result)
+
+    def test_openforms_sdk_tags_default_output(self):
+        result = Template("{% load openforms %}{% openforms_sdk_media %}").render(
+            Context()
+        )
+
+        self.assertEqual(
+            result,
+            '<link rel="stylesheet" href="https://forms.example.com/sdk.css" />\n\n'
+            '<script type="text/javascript" src="https://forms.example.com/sdk.js">'
+            "</script>\n",
+        )
+
+    def test_openforms_sdk_media_with_hints(self):
+        self.config.sdk_js_url = "https://cdn.example.com/sdk.js"
+        self.config.save()
+        html = """
+        {% load openforms %}
+        {% openforms_sdk_media hints=True preload=True load="defer" %}
+        """
+        result = Template(html).render(Context())
+
+        self.assertIn(
+            '<link rel="preconnect" href="https://forms.example.com" />', result
+        )
+        self.assertIn(
+            '<link rel="dns-prefetch" href="https://forms.example.com" />', result
+        )
+        self.assertIn(
+            '<link rel="preconnect" href="https://cdn.example.com" />', result
+        )
+        self.assertEqual(result.count('rel="preconnect"'), 2)
+        self.assertIn(
+            '<link rel="preload" href="https://forms.example.com/sdk.css" as="style" />',
+            result,
+        )
+        self.assertIn('src="https://cdn.example.com/sdk.js" defer></script>', result)
+
+    def test_openforms_sdk_js_with_options(self):
+        html = """
+        {% load openforms %}
+        {% openforms_sdk_js hints=True load="async" %}
+        """
+        result = Template(html).render(Context())
+
+        self.assertIn(
+            '<link rel="preconnect" href="https://forms.example.com" />', result
+        )
+        self.assertIn('src="https://forms.example.com/sdk.js" async></script>', result)
+
+    def test_openforms_sdk_css_with_options(self):
+        html = """
+        {% load openforms %}
+        {% openforms_sdk_css preload=True %}
+        """
+        result = Template(html).render(Context())
+
+        self.assertNotIn('rel="preconnect"', result)
+        self.assertIn('rel="preload"', result)
+        self.assertIn('<link rel="stylesheet"', result)
+
+    def test_openforms_sdk_js_invalid_load(self):
+        html = """
+        {% load openforms %}
+        {% openforms_sdk_js load="lazy" %}
+        """
+
+        with self.assertRaises(TemplateSyntaxError):
+            Template(html).render(Context())
+
+    def test_sdk_tags_are_rendered_once(self):
+        html = """
+        {% load openforms %}
+        {% openforms_sdk_media %}
+        {% openforms_sdk_css %}
+        {% openforms_sdk_js %}
+        """
+        expected = Template(html).render(Context())
+
+        with patch(
+            "openformsclient.templatetags.openforms.render_to_string"
+        ) as mock_render:
+            result = Template(html).render(Context())
+
+        mock_render.assert_not_called()
+        self.assertEqual(result, expected)
+        self.assertIn(f'href="{self.config.sdk_css_url}"', result)
+        self.assertIn(f'src="{self.config.sdk_js_url}"', result)
+
+    def test_configuration_is_loaded_after_change(self):
+        html = """
+        {% load openforms %}
+        {% openforms_sdk_css %}
+        """
+        Template(html).render(Context())
+
+        self.config.sdk_css_url = "https://example.com/other.css"
+        self.config.save()
+
+        result = Template(html).render(Context())
+
+        self.assertIn('href="https://example.com/other.css"', result)
+
+    async def test_configuration_is_preloaded_in_async_view(self):
+        request = RequestFactory().get("/")
+        config = await aget_configuration(request)
+        html = """
+        {% load openforms %}
+        {% openforms_sdk_media %}
+        """
+
+        def render():
+            with self.assertNumQueries(0):
+                return Template(html).render(Context({"request": request}))
+
+        result = await sync_to_async(render)()
+
+        self.assertEqual(config, ConfigurationSnapshot.from_configuration(self.config))
+        self.assertIn(f'href="{self.config.sdk_css_url}"', result)
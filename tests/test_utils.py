@@ -1,10 +1,21 @@
+from unittest.mock import PropertyMock, patch
+
+from django.http import HttpResponse
 from django.test import TestCase
 
+import httpx
 import requests_mock
 
+from openformsclient.async_client import AsyncClient
 from openformsclient.client import Client
 from openformsclient.models import Configuration
-from openformsclient.utils import get_form_choices
+from openformsclient.snapshot import ConfigurationSnapshot
+from openformsclient.utils import (
+    add_link_header,
+    aget_form_choices,
+    get_form_choices,
+    get_link_header,
+)
 
 
 @requests_mock.Mocker()
@@ -100,3 +111,117 @@ class UtilsTests(TestCase):
                 ("1b0d0675-2caf-48e8-beda-c32c6732b63c", "Test 2"),
             ],
         )
+
+
+class AsyncUtilsTests(TestCase):
+    def setUp(self):
+        self.config = Configuration.objects.create(
+            api_root="https://example.com/api/v1/",
+            api_token="token",
+        )
+
+    def _client(self):
+        def handler(request):
+            return httpx.Response(
+                200,
+                json=[
+                    {
+                        "uuid": "1b0d0675-2caf-48e8-beda-c32c6732b63c",
+                        "slug": "test-2",
+                        "name": "Test 2",
+                    },
+                    {
+                        "uuid": "f4423c99-6341-442e-aedc-b47779579f4d",
+                        "slug": "test-1",
+                        "name": "Test 1",
+                    },
+                ],
+            )
+
+        return AsyncClient(
+            self.config.api_root,
+            self.config.api_token,
+            2,
+            transport=httpx.MockTransport(handler),
+        )
+
+    async def test_aget_form_choices_without_config(self):
+        client = AsyncClient("", "", "")
+        result = await aget_form_choices(client)
+        self.assertEqual(result, [])
+
+    async def test_aget_form_choices_with_client(self):
+        result = await aget_form_choices(self._client(), use_uuids=True)
+
+        self.assertListEqual(
+            result,
+            [
+                ("f4423c99-6341-442e-aedc-b47779579f4d", "Test 1"),
+                ("1b0d0675-2caf-48e8-beda-c32c6732b63c", "Test 2"),
+            ],
+        )
+
+    async def test_aget_form_choices_without_client(self):
+        with patch.object(
+            ConfigurationSnapshot, "async_client", new_callable=PropertyMock
+        ) as async_client:
+            async_client.return_value = self._client()
+
+            result = await aget_form_choices()
+
+        self.assertListEqual(
+            result,
+            [
+                ("test-1", "Test 1"),
+                ("test-2", "Test 2"),
+            ],
+        )
+
+
+class LinkHeaderTests(TestCase):
+    def setUp(self):
+        self.config = Configuration.objects.create(
+            api_root="https://forms.example.com/api/v1/",
+            api_token="token",
+            sdk_css_url="https://forms.example.com/sdk.css",
+            sdk_js_url="https://cdn.example.com/sdk.js",
+        )
+
+    def test_get_link_header(self):
+        self.assertEqual(
+            get_link_header(),
+            "<https://forms.example.com>; rel=preconnect, "
+            "<https://cdn.example.com>; rel=preconnect, "
+            "<https://forms.example.com/sdk.css>; rel=preload; as=style, "
+            "<https://cdn.example.com/sdk.js>; rel=preload; as=script",
+        )
+
+    def test_get_link_header_options(self):
+        self.assertEqual(
+            get_link_header(preload=False),
+            "<https://forms.example.com>; rel=preconnect, "
+            "<https://cdn.example.com>; rel=preconnect",
+        )
+        self.assertEqual(get_link_header(preconnect=False, preload=False), "")
+
+    def test_get_link_header_without_sdk(self):
+        self.config.sdk_css_url = ""
+        self.config.sdk_js_url = ""
+        self.config.save()
+
+        self.assertEqual(
+            get_link_header(), "<https://forms.example.com>; rel=preconnect"
+        )
+
+    def test_add_link_header(self):
+        response = HttpResponse()
+        response.headers["Link"] = "</style.css>; rel=preload; as=style"
+
+        add_link_header(response, preload=False)
+
+        self.assertEqual(
+            response.headers["Link"],
+            "</style.css>; rel=preload; as=style, "
+            "<https://forms.example.com>; rel=preconnect, "
+            "<https://cdn.example.com>; rel=preconnect",
+        )
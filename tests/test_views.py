@@ -0,0 +1,96 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from openformsclient.index import FormIndex
+from openformsclient.summary import FormSummary
+
+FORMS = [
+    FormSummary("1b0d0675-2caf-48e8-beda-c32c6732b63c", "test-2", "Test 2"),
+    FormSummary("f4423c99-6341-442e-aedc-b47779579f4d", "test-1", "Test 1"),
+    FormSummary("3285e94f-adae-4a5c-a467-30690a279364", "other", "Other"),
+]
+
+
+@patch("openformsclient.views.get_form_index", lambda: FormIndex(FORMS))
+class FormAutocompleteViewTests(TestCase):
+    url = reverse("openformsclient:form-autocomplete")
+
+    def setUp(self):
+        self.user = User.objects.create_user("admin", is_staff=True)
+        self.client.force_login(self.user)
+
+    def test_search(self):
+        response = self.client.get(self.url, {"term": "test"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "results": [
+                    {"id": "test-1", "text": "Test 1"},
+                    {"id": "test-2", "text": "Test 2"},
+                ],
+                "pagination": {"more": False},
+            },
+        )
+
+    def test_search_uuids(self):
+        response = self.client.get(self.url, {"term": "oth", "use_uuids": "1"})
+
+        self.assertEqual(
+            response.json()["results"],
+            [{"id": "3285e94f-adae-4a5c-a467-30690a279364", "text": "Other"}],
+        )
+
+    @patch("openformsclient.views.FormAutocompleteView.paginate_by", 2)
+    def test_pagination(self):
+        response = self.client.get(self.url)
+        self.assertEqual(
+            response.json(),
+            {
+                "results": [
+                    {"id": "other", "text": "Other"},
+                    {"id": "test-1", "text": "Test 1"},
+                ],
+                "pagination": {"more": True},
+            },
+        )
+
+        response = self.client.get(self.url, {"page": "2"})
+        self.assertEqual(
+            response.json(),
+            {
+                "results": [{"id": "test-2", "text": "Test 2"}],
+                "pagination": {"more": False},
+            },
+        )
+
+    def test_search_error(self):
+        with patch(
+            "openformsclient.views.get_form_index", side_effect=Exception("Down")
+        ):
+            with self.assertLogs("openformsclient.views", level="ERROR"):
+                response = self.client.get(self.url, {"term": "test"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(), {"results": [], "pagination": {"more": False}}
+        )
+
+    def test_staff_required(self):
+        self.user.is_staff = False
+        self.user.save()
+
+        response = self.client.get(self.url, {"term": "test"})
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_login_required(self):
+        self.client.logout()
+
+        response = self.client.get(self.url, {"term": "test"})
+
+        self.assertEqual(response.status_code, 302)
@@ -0,0 +1,106 @@
+from unittest.mock import patch
+
+from django.db.models.fields import BLANK_CHOICE_DASH
+from django.forms import Select, formset_factory, modelform_factory
+from django.test import TestCase
+
+from openformsclient.index import FormIndex
+from openformsclient.summary import FormSummary
+from openformsclient.widgets import OpenFormsSelect
+
+from .test_models import Dummy
+
+CHOICES = [
+    ("", "---------"),
+    ("test-1", "Test 1"),
+    ("test-2", "Test <2> & more"),
+]
+
+
+class OpenFormsSelectTests(TestCase):
+    def setUp(self):
+        OpenFormsSelect._rendered_options.clear()
+
+    def test_renders_like_select(self):
+        for value in [None, "", "test-1", "test-2", "unknown"]:
+            with self.subTest(value=value):
+                self.assertHTMLEqual(
+                    OpenFormsSelect(choices=CHOICES).render("form", value),
+                    Select(choices=CHOICES).render("form", value),
+                )
+                self.assertEqual(
+                    OpenFormsSelect(choices=CHOICES).render("form", value),
+                    Select(choices=CHOICES).render("form", value),
+                )
+
+    def test_renders_option_groups(self):
+        choices = [("Group", CHOICES)]
+
+        self.assertEqual(
+            OpenFormsSelect(choices=choices).render("form", "test-1"),
+            Select(choices=choices).render("form", "test-1"),
+        )
+
+    def test_options_are_rendered_once(self):
+        widget = OpenFormsSelect(choices=CHOICES)
+
+        with patch.object(
+            OpenFormsSelect, "_render_options", wraps=widget._render_options
+        ) as mock_render:
+            first = widget.render("form-0", "test-1")
+            second = widget.render("form-1", "test-2")
+
+        mock_render.assert_called_once()
+        self.assertIn('<option value="test-1" selected>Test 1</option>', first)
+        self.assertIn('<option value="test-1">Test 1</option>', second)
+        self.assertIn(
+            '<option value="test-2" selected>Test &lt;2&gt; &amp; more</option>',
+            second,
+        )
+
+
+@patch(
+    "openformsclient.models.get_form_index",
+    lambda: FormIndex(
+        [
+            FormSummary("1b0d0675-2caf-48e8-beda-c32c6732b63c", "test-2", "Test 2"),
+            FormSummary("f4423c99-6341-442e-aedc-b47779579f4d", "test-1", "Test 1"),
+        ]
+    ),
+)
+class FormsetTests(TestCase):
+    def setUp(self):
+        OpenFormsSelect._rendered_options.clear()
+
+    def test_choices_are_shared(self):
+        field = Dummy._meta.get_field("form_slug")
+        index = FormIndex(
+            [FormSummary("f4423c99-6341-442e-aedc-b47779579f4d", "test-1", "Test 1")]
+        )
+
+        with patch("openformsclient.models.get_form_index", lambda: index):
+            choices = list(field.get_choices()())
+
+        self.assertEqual(choices, [("", "---------"), ("test-1", "Test 1")])
+        self.assertIs(
+            index.get_choices(blank_choice=BLANK_CHOICE_DASH),
+            index.get_choices(blank_choice=BLANK_CHOICE_DASH),
+        )
+
+    def test_formset_renders_options_once(self):
+        DummyFormSet = formset_factory(
+            modelform_factory(Dummy, fields=["form_slug"]), extra=10
+        )
+
+        with patch.object(
+            OpenFormsSelect,
+            "_render_options",
+            autospec=True,
+            side_effect=OpenFormsSelect._render_options,
+        ) as mock_render:
+            formset = DummyFormSet(initial=[{"form_slug": "test-1"}])
+            html = "".join(form["form_slug"].as_widget() for form in formset)
+
+        mock_render.assert_called_once()
+        self.assertEqual(html.count('<option value="test-2">Test 2</option>'), 11)
+        self.assertEqual(html.count('<option value="test-1" selected>'), 1)